@@ -117,9 +117,8 @@ def write_portfolio_report_xlsx(
         toggle = 0
         current_styles = styles_1
 
-        for i, row in summary_df.iterrows():
-            row_type = row['Type']
-            name = row['Name']
+        for row_type, name, market_value, allocation, ret in \
+                summary_df[['Type', 'Name', 'MarketValue', 'Allocation', 'Return']].itertuples(index=False, name=None):
             sheet.set_row(current_row, 17)
             
              # COLOR LOGIC
@@ -132,10 +131,10 @@ def write_portfolio_report_xlsx(
                 # Portfolio Bucket
                 fmts = current_styles['bucket']
                 sheet.write(current_row, 1, name, fmts['txt'])
-                sheet.write(current_row, 2, row['MarketValue'], fmts['mv'])
-                sheet.write(current_row, 3, row['Allocation'], fmts['alloc'])
+                sheet.write(current_row, 2, market_value, fmts['mv'])
+                sheet.write(current_row, 3, allocation, fmts['alloc'])
                 
-                sheet.write(current_row, 4, row['Return'], fmts['alloc'])
+                sheet.write(current_row, 4, ret, fmts['alloc'])
 
             elif row_type == 'Benchmark':
                 # Use Benchmark formats from current set (Matches Bucket BG)
@@ -143,7 +142,7 @@ def write_portfolio_report_xlsx(
                 sheet.write(current_row, 1, name, fmts['txt'])
                 sheet.write(current_row, 2, "", fmts['empty']) 
                 sheet.write(current_row, 3, "", fmts['empty']) 
-                sheet.write(current_row, 4, row['Return'], fmts['pct'])
+                sheet.write(current_row, 4, ret, fmts['pct'])
             
             current_row += 1
 
@@ -230,18 +229,28 @@ def write_portfolio_report_xlsx(
         details_sheet.write('A1', "Detailed Holdings Breakdown", fmt_title)
         details_sheet.write('A2', f"Generated on {datetime.date.today()}", fmt_subtitle)
 
-        bucket_order = summary_df[summary_df['Type'] == 'Bucket']['Name'].unique().tolist()
-        sorter_map = {name: i for i, name in enumerate(bucket_order)}
+        bucket_order = pd.Index(summary_df[summary_df['Type'] == 'Bucket']['Name'].unique())
         
-        holdings_df['sort_key'] = holdings_df['asset_class'].map(sorter_map).fillna(999)
-        sorted_holdings = holdings_df.sort_values(['sort_key', 'weight'], ascending=[True, False])
+        # Integer position of each holding's bucket in one vectorized lookup; unknown classes sort last
+        sort_key = bucket_order.get_indexer(holdings_df['asset_class'])
+        sort_key[sort_key < 0] = len(bucket_order)
+        sorted_holdings = holdings_df.assign(sort_key=sort_key).sort_values(['sort_key', 'weight'], ascending=[True, False])
         
         current_row = 4
         cols = ['Ticker', 'Name', 'Cost Basis', 'Market Value', 'Allocation', 'Return']
 
-        unique_buckets = sorted_holdings['asset_class'].unique()
+        # Return column resolved once for the whole book: settled cash shows its contribution,
+        # the cash balance row shows 0, everything else its cumulative return
+        tick = sorted_holdings['ticker'].astype(str).str.upper()
+        ret_col = sorted_holdings['cumulative_return'].mask(sorted_holdings['ticker'] == "CASH_BAL", 0.0)
+        if "contribution" in sorted_holdings.columns:
+            use_contrib = (tick == "USD") & sorted_holdings['contribution'].notna()
+            ret_col = ret_col.mask(use_contrib, sorted_holdings['contribution'])
+        if 'official_name' not in sorted_holdings.columns: sorted_holdings['official_name'] = ''
+        sorted_holdings['_ret'] = ret_col
 
-        for bucket in unique_buckets:
+        # Holdings are already in bucket order, so one unsorted groupby walks each bucket once
+        for bucket, subset in sorted_holdings.groupby('asset_class', sort=False):
             # Section Header
             details_sheet.merge_range(current_row, 0, current_row, 5, bucket.upper(), fmt_h_header)
             current_row += 1
@@ -252,22 +261,14 @@ def write_portfolio_report_xlsx(
             current_row += 1
             
             # Data
-            subset = sorted_holdings[sorted_holdings['asset_class'] == bucket]
-            
-            for _, pos in subset.iterrows():
-                details_sheet.write(current_row, 0, pos['ticker'], fmt_h_txt)
-                details_sheet.write(current_row, 1, pos.get('official_name', ''), fmt_h_txt)
-                details_sheet.write(current_row, 2, pos['avg_cost'], fmt_h_mv)
-                details_sheet.write(current_row, 3, pos['raw_value'], fmt_h_mv)
-                details_sheet.write(current_row, 4, pos['weight'], fmt_h_alloc)
-                
-                tick = str(pos['ticker']).upper()
-                if tick == "USD" and "contribution" in holdings_df.columns and pd.notna(pos.get("contribution")):
-                    details_sheet.write(current_row, 5, pos["contribution"], fmt_h_alloc)
-                elif pos["ticker"] == "CASH_BAL":
-                    details_sheet.write(current_row, 5, 0.0, fmt_h_alloc)
-                else:
-                    details_sheet.write(current_row, 5, pos["cumulative_return"], fmt_h_alloc)
+            for ticker, official_name, avg_cost, raw_value, weight, ret in \
+                    subset[['ticker', 'official_name', 'avg_cost', 'raw_value', 'weight', '_ret']].itertuples(index=False, name=None):
+                details_sheet.write(current_row, 0, ticker, fmt_h_txt)
+                details_sheet.write(current_row, 1, official_name, fmt_h_txt)
+                details_sheet.write(current_row, 2, avg_cost, fmt_h_mv)
+                details_sheet.write(current_row, 3, raw_value, fmt_h_mv)
+                details_sheet.write(current_row, 4, weight, fmt_h_alloc)
+                details_sheet.write(current_row, 5, ret, fmt_h_alloc)
                 
                 current_row += 1
             
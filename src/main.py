@@ -4,6 +4,7 @@ import re
 import csv
 import datetime
 import traceback
+from concurrent.futures import ProcessPoolExecutor
 
 # --- IMPORTS ---
 from ib_connector import fetch_files_via_sftp, decrypt_pgp_files
@@ -98,6 +99,11 @@ IGNORE_STARTSWITH = [
     '912797PN1',  # Treasury Bond Series
 ]
 
+# --- 8. PARALLEL REPORT GENERATION ---
+# Max worker processes generating account reports at once (1 = one after another; capped at CPU count).
+# Each report is independent; console output from different accounts will interleave.
+REPORT_WORKERS = 4
+
 
 #  ==========================================
 #   HELPERS
@@ -159,15 +165,21 @@ def resolve_benchmark_for_account(account_name):
 
 
 # --- LOCAL AUTO-CLASSIFY ---
+# Hardcoded ticker -> asset class (checked before the name keywords)
+_TICKER_ASSET_CLASS = {
+    **dict.fromkeys(['USD', 'ICSH'], 'Cash'),
+    **dict.fromkeys(['VEA', 'VWO', 'IMTM', 'VXUS'], 'International Equities'),
+    **dict.fromkeys(['BND', 'VGIT', 'VGSH'], 'Fixed Income'),
+    **dict.fromkeys(['BCI', 'GSG', 'VNQ'], 'Alternative Assets'),
+}
+
 def auto_classify_asset(ticker: str, security_name: str) -> str:
     t = str(ticker).upper().strip()
-    n = str(security_name).upper().strip()
     
     # 1. Hardcoded
-    if t in ['USD', 'ICSH']: return 'Cash'
-    if t in ['VEA', 'VWO', 'IMTM', 'VXUS']: return 'International Equities'
-    if t in ['BND', 'VGIT', 'VGSH']: return 'Fixed Income'
-    if t in ['BCI', 'GSG', 'VNQ']: return 'Alternative Assets'
+    if t in _TICKER_ASSET_CLASS: return _TICKER_ASSET_CLASS[t]
+    
+    n = str(security_name).upper().strip()
     
     # 2. Keywords
     if any(k in n for k in ['INTL', 'EMERGING', 'EUROPE', 'ASIA', 'DEVELOPED']): return 'International Equities'
@@ -507,10 +519,10 @@ def generate_report_for_account(quarter_csv, inception_csv, shared,
         name_map = fetch_security_names_yf(all_tickers)
         
         holdings['official_name'] = holdings['ticker'].map(name_map).fillna('')
-        holdings['asset_class'] = holdings.apply(
-            lambda row: auto_classify_asset(row['ticker'], row['official_name']), 
-            axis=1
-        )
+        holdings['asset_class'] = [
+            auto_classify_asset(ticker, name)
+            for ticker, name in zip(holdings['ticker'], holdings['official_name'])
+        ]
             
         # === Calculate Weights ===
         total_value = holdings['raw_value'].sum()
@@ -560,7 +572,7 @@ def generate_report_for_account(quarter_csv, inception_csv, shared,
         )
         
         # Slice specifically for the quarter
-        period_subset = bench_returns_df.loc[quarter_start_date:report_date].copy()
+        period_subset = bench_returns_df.loc[quarter_start_date:report_date]
         if not period_subset.empty:
             bench_growth_period = get_cumulative_index(period_subset, start_value=100)
             
@@ -659,15 +671,17 @@ def generate_report_for_account(quarter_csv, inception_csv, shared,
     for b in my_buckets:
         if b not in sorted_buckets: sorted_buckets.append(b)
 
-    for bucket in sorted_buckets:
-        bucket_data = holdings[holdings['asset_class'] == bucket]
+    # Per-bucket totals from one groupby each, instead of re-masking holdings for every bucket
+    bucket_mv = holdings.groupby('asset_class', sort=False)['raw_value'].sum().to_dict()
+    if 'contribution' in holdings.columns:
+        bucket_contrib = holdings['contribution'].fillna(0.0).groupby(holdings['asset_class'], sort=False).sum().to_dict()
+    else:
+        bucket_contrib = {}
 
-        b_mv = bucket_data['raw_value'].sum()
+    for bucket in sorted_buckets:
+        b_mv = bucket_mv.get(bucket, 0.0)
         # Class return: sum of Performance-by-Symbol Contribution (same scale as statement CumulativeReturn).
-        if not bucket_data.empty and 'contribution' in bucket_data.columns:
-            bucket_return = float(bucket_data['contribution'].fillna(0.0).sum())
-        else:
-            bucket_return = 0.0
+        bucket_return = float(bucket_contrib.get(bucket, 0.0))
 
         # Add Bucket Row
         summary_rows.append({
@@ -739,6 +753,40 @@ def generate_report_for_account(quarter_csv, inception_csv, shared,
 #  ==========================================
 #   MAIN PIPELINE
 #  ==========================================
+def run_account_job(job):
+    """
+    Generates one paired account's report. Module-level so it can run in a worker process.
+    job: (position, total, acct_id, account_info, shared)
+    Returns: (acct_id, succeeded)
+    """
+    i, total, acct_id, info, shared = job
+    label = "CONSOLIDATED" if acct_id.startswith('CONSOL_') else "INDIVIDUAL"
+    
+    # Resolve per-client benchmark ratio
+    bench_key, bench_weights = resolve_benchmark_for_account(info['name'])
+    
+    print(f"\n{'='*70}")
+    print(f"  [{label}] PROCESSING {i}/{total}: {info['name']} ({acct_id})")
+    print(f"  Quarterly:  {os.path.basename(info['quarterly'])}")
+    print(f"  Inception:  {os.path.basename(info['inception'])}")
+    print(f"  Benchmark:  {bench_key}")
+    print(f"{'='*70}")
+    
+    try:
+        result = generate_report_for_account(
+            quarter_csv=info['quarterly'],
+            inception_csv=info['inception'],
+            shared=shared,
+            benchmark_key=bench_key,
+            benchmark_weights=bench_weights,
+        )
+        return acct_id, result is not None
+    except Exception as e:
+        print(f"ERROR generating report for {info['name']} ({acct_id}): {e}")
+        traceback.print_exc()
+        return acct_id, False
+
+
 def run_pipeline():
     # --- PATHS SETUP ---
     script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -912,45 +960,23 @@ def run_pipeline():
     consolidated_success = 0
     consolidated_fail = 0
     
-    for i, (acct_id, info) in enumerate(ready_accounts.items(), 1):
-        is_consolidated = acct_id.startswith('CONSOL_')
-        label = "CONSOLIDATED" if is_consolidated else "INDIVIDUAL"
-        
-        # Resolve per-client benchmark ratio
-        bench_key, bench_weights = resolve_benchmark_for_account(info['name'])
-        
-        print(f"\n{'='*70}")
-        print(f"  [{label}] PROCESSING {i}/{len(ready_accounts)}: {info['name']} ({acct_id})")
-        print(f"  Quarterly:  {os.path.basename(info['quarterly'])}")
-        print(f"  Inception:  {os.path.basename(info['inception'])}")
-        print(f"  Benchmark:  {bench_key}")
-        print(f"{'='*70}")
-        
-        try:
-            result = generate_report_for_account(
-                quarter_csv=info['quarterly'],
-                inception_csv=info['inception'],
-                shared=shared,
-                benchmark_key=bench_key,
-                benchmark_weights=bench_weights,
-            )
-            if result is not None:
-                if is_consolidated:
-                    consolidated_success += 1
-                else:
-                    individual_success += 1
-            else:
-                if is_consolidated:
-                    consolidated_fail += 1
-                else:
-                    individual_fail += 1
-        except Exception as e:
-            print(f"ERROR generating report for {info['name']} ({acct_id}): {e}")
-            traceback.print_exc()
-            if is_consolidated:
-                consolidated_fail += 1
-            else:
-                individual_fail += 1
+    jobs = [(i, len(ready_accounts), acct_id, info, shared)
+            for i, (acct_id, info) in enumerate(ready_accounts.items(), 1)]
+    workers = min(REPORT_WORKERS, len(jobs), os.cpu_count() or 1)
+    if workers > 1:
+        print(f"\n   > Generating {len(jobs)} report(s) across {workers} worker processes")
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            outcomes = list(pool.map(run_account_job, jobs))
+    else:
+        outcomes = [run_account_job(job) for job in jobs]
+    
+    for acct_id, succeeded in outcomes:
+        if acct_id.startswith('CONSOL_'):
+            if succeeded: consolidated_success += 1
+            else: consolidated_fail += 1
+        else:
+            if succeeded: individual_success += 1
+            else: individual_fail += 1
     
     # --- FINAL SUMMARY ---
     print(f"\n{'='*70}")
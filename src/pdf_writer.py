@@ -1,10 +1,12 @@
 import pandas as pd
-import altair as alt
+import io
 import re
 from fpdf import FPDF
 from fpdf.fonts import FontFace
 import os
 import datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 # --- CONSTANTS & COLORS ---
 C_BLUE_PRIMARY = (89, 120, 247)   # #5978F7
@@ -15,6 +17,18 @@ C_TEXT_LIGHT_GREY = (180, 180, 180) # Footnotes, bottom-of-page disclosures
 C_TEXT_GREY     = (100, 100, 100) # Benchmark rows, "Reportings as of …" lines
 C_WHITE         = (255, 255, 255)  
 
+# --- TABLE STYLES (shared across pages and reports) ---
+FF_HEADER       = FontFace(size_pt=12, emphasis="BOLD", color=C_WHITE, fill_color=C_BLUE_LOGO)
+FF_REGULAR      = FontFace(size_pt=12, emphasis=None, color=(0,0,0), fill_color=C_WHITE)
+FF_BUCKET       = FontFace(size_pt=12, emphasis="BOLD", color=(0,0,0), fill_color=C_LIGHT_BG)
+FF_BENCH        = FontFace(size_pt=12, emphasis="ITALICS", color=C_TEXT_GREY, fill_color=C_WHITE)
+FF_HIGHLIGHT    = FontFace(size_pt=12, fill_color=C_LIGHT_BG)
+FF_ROW_BOLD     = FontFace(emphasis="BOLD", size_pt=12, fill_color=C_LIGHT_BG)  # Totals / section rows
+FF_ROW_PLAIN    = FontFace(emphasis="", size_pt=12, fill_color=C_WHITE)
+FF_DISCL_HEADER = FontFace(size_pt=8, emphasis="BOLD", color=C_WHITE, fill_color=C_BLUE_LOGO)
+FF_DISCL_ROW    = FontFace(size_pt=8, emphasis="", color=(0, 0, 0), fill_color=C_WHITE)
+FF_DISCL_CALC   = FontFace(size_pt=8, emphasis="ITALICS", color=(80, 80, 80), fill_color=C_WHITE)
+
 # --- PAGE DISCLOSURES ---
 # Page: Breakdown of Accounts
 DISCLOSURE_BREAKDOWN = (
@@ -117,6 +131,33 @@ BENCHMARK_DEFINITIONS = [
      "highest-quality fixed-income assets. (Expense Ratio: 0.14%)"),
 ]
 
+# Carlito is metric-compatible with Calibri. Registered once per document in
+# PortfolioPDF.__init__; fpdf2 subsets the glyphs a single time at output().
+CARLITO_FONT_FILES = {
+    '':  'data/pdf_resources/fonts/Carlito-Regular.ttf',
+    'B': 'data/pdf_resources/fonts/Carlito-Bold.ttf',
+    'I': 'data/pdf_resources/fonts/Carlito-Italic.ttf',
+}
+
+# Wrapped line counts for fixed text blocks (Goals, Market Review). The text comes from the shared
+# info_for_pdf.xlsx, so a batch would otherwise re-measure the same paragraphs for every report.
+_LINE_COUNT_CACHE = {}
+
+
+def _wrapped_line_count(pdf, width, line_h, text):
+    """Number of lines multi_cell() will wrap `text` into at the current font, memoized per font/width."""
+    key = (text, width, line_h, pdf.font_family, pdf.font_style, pdf.font_size_pt)
+    n = _LINE_COUNT_CACHE.get(key)
+    if n is None:
+        n = _LINE_COUNT_CACHE[key] = len(pdf.multi_cell(width, line_h, text, dry_run=True, output="LINES"))
+    return n
+
+
+@lru_cache(maxsize=8)
+def _logo_available(path):
+    """Cached existence check for logo files (the footer asks on every page)."""
+    return bool(path) and os.path.exists(path)
+
 class PortfolioPDF(FPDF):
     def __init__(self, orientation='P', unit='mm', format='A4'):
         super().__init__(orientation, unit, format)
@@ -130,9 +171,8 @@ class PortfolioPDF(FPDF):
         # --- FONT LOADING ---
         self.main_font = 'Helvetica' # Default fallback
         try:
-            self.add_font('Carlito', '', 'data/pdf_resources/fonts/Carlito-Regular.ttf', uni=True)  # Carlito is Metric-compatible with Calibri
-            self.add_font('Carlito', 'B', 'data/pdf_resources/fonts/Carlito-Bold.ttf',uni=True)
-            self.add_font('Carlito', 'I', 'data/pdf_resources/fonts/Carlito-Italic.ttf', uni=True)
+            for style, font_path in CARLITO_FONT_FILES.items():
+                self.add_font('Carlito', style, font_path)
             self.main_font = 'Carlito'
             print("   > Loaded custom Calibri/Carlito font from data/fonts folder.")
         except Exception as e:
@@ -170,7 +210,7 @@ class PortfolioPDF(FPDF):
 
         # --- LOGO (RIGHT) ---
         logo_y = base_y + 2
-        if self.text_logo_path and os.path.exists(self.text_logo_path):
+        if _logo_available(self.text_logo_path):
             self.image(self.text_logo_path, x=self.w - 39, y=logo_y, h=8)
 
         # --- Confidential Text (LEFT) ---
@@ -190,6 +230,31 @@ class PortfolioPDF(FPDF):
         self.cell(0, 5, f'Page {display_num}', align='C')
         
 
+# 'Smart' punctuation from info_for_pdf.xlsx -> ASCII, applied in a single translate() pass
+_SMART_PUNCT = str.maketrans({
+    '\u2018': "'",  # Left single quote
+    '\u2019': "'",  # Right single quote
+    '\u201c': '"',  # Left double quote
+    '\u201d': '"',  # Right double quote
+    '\u2013': '-',  # En dash
+    '\u2014': '-',  # Em dash
+    '\u2026': '...',# Ellipsis
+})
+
+
+def clean_text(text):
+    """Replaces 'smart' punctuation with standard ASCII."""
+    if not isinstance(text, str):
+        return str(text)
+    if text.isascii():  # nothing to replace and already latin-1 safe
+        return text
+    text = text.translate(_SMART_PUNCT)
+    if text.isascii():  # smart punctuation was the only non-ASCII
+        return text
+    # Final safety net: replace any remaining non-latin-1 chars with '?'
+    return text.encode('latin-1', 'replace').decode('latin-1')
+
+
 def clean_display_name(name: str) -> str:
     """Strips custodian boilerplate from IBKR account names for PDF display."""
     n = str(name).strip()
@@ -204,6 +269,11 @@ def clean_display_name(name: str) -> str:
 # matches what the PDF shows.
 _IPS_BAND_COMPARE_DECIMALS = 3  # ratio rounded to 0.001 == 0.1%
 
+# Expanded performance: books above the threshold are rendered in fixed-size table chunks.
+_HOLDINGS_TABLE_CHUNK = 50
+_HOLDINGS_TABLE_CHUNK_THRESHOLD = 200
+_HOLDING_NAME_MAX_CHARS = 60  # longer names are cut and end in "..."
+
 
 def _ips_band_compliant(v_cur, v_min, v_max, ndigits=_IPS_BAND_COMPARE_DECIMALS):
     """True if current is within [min, max] after rounding to the PDF's one-decimal percent precision."""
@@ -217,79 +287,62 @@ def _ips_band_compliant(v_cur, v_min, v_max, ndigits=_IPS_BAND_COMPARE_DECIMALS)
 
 
 #  === IPS COMPLIANCE TABLE DATA ===
+# (Table label, info_for_pdf.xlsx key stem, summary_df bucket name)
+_IPS_CATEGORIES = (
+    ('US Equities',            'us_equity',     'U.S. Equities'),
+    ('International Equities', 'non_us_equity', 'International Equities'),
+    ('Fixed Income',           'fixed_income',  'Fixed Income'),
+    ('Alternatives',           'alternatives',  'Alternative Assets'),
+    ('Cash',                   'cash',          'Cash'),
+)
+
+
 def get_ips_table_data(pdf_info, summary_df):
-    """Constructs data rows: (Category, Min, Max, Target, Current)"""
-    rows = []
-    
+    """Constructs data rows: (Category, Min, Max, Target, Current, Compliance Status)"""
     def get_val(key, default=0.0):
         try: return float(pdf_info.get(key, default))
-        except: return default
+        except (TypeError, ValueError): return default
 
-    def get_current(bucket_name):
-        try:
-            row = summary_df[summary_df['Name'] == bucket_name]
-            if not row.empty: return row['Allocation'].iloc[0]
-            return 0.0
-        except: return 0.0
-
-    # 1. US Equity
-    us_min = get_val('page_4_ips_us_equity_range_min')
-    us_max = get_val('page_4_ips_us_equity_range_max')
-    us_tgt = get_val('page_4_ips_us_equity_target')
-    us_cur = get_current('U.S. Equities')
-    rows.append(('US Equities', us_min, us_max, us_tgt, us_cur))
-
-    # 2. International Equities (single band from info_for_pdf.xlsx)
-    intl_min = get_val('page_4_ips_non_us_equity_range_min')
-    intl_max = get_val('page_4_ips_non_us_equity_range_max')
-    intl_tgt = get_val('page_4_ips_non_us_equity_target')
-    intl_cur = get_current('International Equities')
-    rows.append(('International Equities', intl_min, intl_max, intl_tgt, intl_cur))
-
-    # 3. Fixed Income (single band)
-    fi_min = get_val('page_4_ips_fixed_income_range_min')
-    fi_max = get_val('page_4_ips_fixed_income_range_max')
-    fi_tgt = get_val('page_4_ips_fixed_income_target')
-    fi_cur = get_current('Fixed Income')
-    rows.append(('Fixed Income', fi_min, fi_max, fi_tgt, fi_cur))
-
-    # 4. Alternatives
-    alt_min = get_val('page_4_ips_alternatives_range_min')
-    alt_max = get_val('page_4_ips_alternatives_range_max')
-    alt_tgt = get_val('page_4_ips_alternatives_target')
-    alt_cur = get_current('Alternative Assets')
-    rows.append(('Alternatives', alt_min, alt_max, alt_tgt, alt_cur))
-
-    # 5. Cash
-    cash_min = get_val('page_4_ips_cash_range_min')
-    cash_max = get_val('page_4_ips_cash_range_max')
-    cash_tgt = get_val('page_4_ips_cash_target')
-    cash_cur = get_current('Cash')
-    rows.append(('Cash', cash_min, cash_max, cash_tgt, cash_cur))
-    
+    # One pass over summary_df; first row wins for a repeated name
+    alloc_map = {}
+    if 'Name' in summary_df.columns and 'Allocation' in summary_df.columns:
+        firsts = summary_df.drop_duplicates('Name')
+        alloc_map = dict(zip(firsts['Name'], firsts['Allocation']))
+
+    rows = []
+    for label, stem, bucket_name in _IPS_CATEGORIES:
+        v_min = get_val(f'page_4_ips_{stem}_range_min')
+        v_max = get_val(f'page_4_ips_{stem}_range_max')
+        v_tgt = get_val(f'page_4_ips_{stem}_target')
+        v_cur = alloc_map.get(bucket_name, 0.0)
+        # Compliance is resolved here so the table and chart only format it
+        status = "Compliant" if _ips_band_compliant(v_cur, v_min, v_max) else "Non-Compliant"
+        rows.append((label, v_min, v_max, v_tgt, v_cur, status))
     return rows
 
 
+#  === CHART RENDERING ===
+def _chart_to_png(chart, scale=3.0):
+    """Renders an Altair chart to an in-memory PNG through vl-convert (same output as chart.save, no temp file)."""
+    import altair as alt
+    import vl_convert as vlc
+    # Data is inlined into the spec; drop Altair's notebook-oriented 5000-row cap so long
+    # inception histories don't raise MaxRowsError (idempotent, safe across chart threads)
+    alt.data_transformers.enable('default', max_rows=None)
+    vl_version = "_".join(alt.SCHEMA_VERSION.split(".")[:2])
+    return io.BytesIO(vlc.vegalite_to_png(chart.to_dict(), vl_version=vl_version, scale=scale))
+
+
 #  === IPS COMPLIANCE BOX & WHISKER PLOT ===
 def generate_ips_chart(ips_rows):
-    """Creates a 'Box and Whisker' style plot for IPS Compliance. Range (Grey Bar), Target (Black Tick), Current (Colored Point)."""
+    """Creates a 'Box and Whisker' style plot for IPS Compliance. Range (Grey Bar), Target (Black Tick), Current (Colored Point).
+    Returns an in-memory PNG (BytesIO) for pdf.image(), or None."""
     if not ips_rows: return None
+    import altair as alt  # deferred: ~0.35s import, only paid when a chart page renders
     
-    # 1. Prepare Data
-    data = []
-    for cat, v_min, v_max, v_tgt, v_cur in ips_rows:
-        is_compliant = _ips_band_compliant(v_cur, v_min, v_max)
-        status_color = "#329632" if is_compliant else "#C83232" # Change to differentiate Compliance Status
-        
-        data.append({
-            "Category": cat,
-            "Min": v_min,
-            "Max": v_max,
-            "Target": v_tgt,
-            "Current": v_cur
-        })
-    
-    df = pd.DataFrame(data)
+    # 1. Prepare Data (columnar straight from the row tuples)
+    cats, mins, maxs, tgts, curs, _statuses = zip(*ips_rows)
+    df = pd.DataFrame({"Category": cats, "Min": mins, "Max": maxs, "Target": tgts, "Current": curs})
     
     # 2. Base Chart
     base = alt.Chart(df).encode(y=alt.Y("Category", title=None, sort=None))
@@ -319,15 +372,14 @@ def generate_ips_chart(ips_rows):
         font='Calibri', fontSize=15
     )
 
-    chart_path = "temp_ips_chart.png"
-    chart.save(chart_path, scale_factor=3.0, engine="vl-convert")
-    return chart_path
+    return _chart_to_png(chart)
     
 
 # === PORTFOLIO RETURN CHART ===
 def generate_line_chart(comparison_df):
-    """Line Chart: Portfolio vs Benchmark (Dynamic Name)."""
+    """Line Chart: Portfolio vs Benchmark (Dynamic Name). Returns an in-memory PNG (BytesIO), or None."""
     if comparison_df is None or comparison_df.empty: return None
+    import altair as alt
     
     # 1. No Melt Needed
     # The new prepare_chart_data sends us data that is ALREADY in long format:
@@ -373,13 +425,12 @@ def generate_line_chart(comparison_df):
         strokeWidth=0
     )
     
-    chart.save("temp_line_chart.png", scale_factor=3.0, engine="vl-convert")
-    return "temp_line_chart.png"
+    return _chart_to_png(chart)
     
     
 #  === ASSET ALLOCATION CHART CREATION ===
 def generate_donut_chart(summary_df):
-    """Generates a Donut chart with ~300 width, max 500 height, and large Legend labels."""
+    """Generates a Donut chart with ~300 width, max 500 height, and large Legend labels. Returns an in-memory PNG (BytesIO)."""
     source = summary_df[
         (summary_df['Type'] == 'Bucket') & 
         (summary_df['Name'] != 'Other')
@@ -389,13 +440,22 @@ def generate_donut_chart(summary_df):
 
     # PREPARE LEGEND LABELS
     # Combine Name + Allocation % for the Legend
-    source['LegendLabel'] = source.apply(
-        lambda row: f"{row['Name']}: {row['Allocation']:.1%}", axis=1
-    )
-    
-    # Sort Descending
-    source = source.sort_values('MarketValue', ascending=False)
+    source['LegendLabel'] = source['Name'].map(str) + ": " + source['Allocation'].map('{:.1%}'.format)
     
+    # Sort Descending; only the plotted columns go into the inline Vega-Lite data
+    source = source.sort_values('MarketValue', ascending=False)[['LegendLabel', 'MarketValue']]
+
+    # Accounts with the same bucket mix (labels + values to the cent) share one rendered PNG
+    slices = tuple(zip(source['LegendLabel'], source['MarketValue'].round(2).tolist()))
+    return io.BytesIO(_render_donut_png(slices))
+
+
+@lru_cache(maxsize=64)
+def _render_donut_png(slices):
+    """Renders the donut for a tuple of (legend label, market value) slices, largest first. Returns PNG bytes."""
+    import altair as alt
+    source = pd.DataFrame(list(slices), columns=['LegendLabel', 'MarketValue'])
+
     # Colors
     domain = source['LegendLabel'].tolist()
     range_colors = ['#5978F7', '#0070C0', '#2F5597', '#BDD7EE', '#7F7F7F', '#D9D9D9']
@@ -423,8 +483,7 @@ def generate_donut_chart(summary_df):
                 rowPadding=10
             ) 
         ),
-        order=alt.Order('MarketValue', sort="descending"),
-        tooltip=["Name", "MarketValue", alt.Tooltip("Allocation", format=".2%")]
+        order=alt.Order('MarketValue', sort="descending")
     )
     
     # CONFIGURE
@@ -435,9 +494,7 @@ def generate_donut_chart(summary_df):
         strokeWidth=0
     )
 
-    chart_path = "temp_chart.png"
-    chart.save(chart_path, scale_factor=3.0, engine="vl-convert")
-    return chart_path
+    return _chart_to_png(chart).getvalue()
 
 
 #  ==========================================
@@ -467,29 +524,17 @@ def write_portfolio_report(summary_df, holdings_df, key_statistics, total_metric
 
     # Pre-calculate IPS Data Rows
     ips_rows = get_ips_table_data(pdf_info, summary_df)
+
+    # Charts don't depend on page layout: render them off-thread while the earlier pages are built.
+    # This also absorbs vl-convert's one-off runtime start-up on the first report.
+    chart_pool = ThreadPoolExecutor(max_workers=3)
+    ips_chart_future = chart_pool.submit(generate_ips_chart, ips_rows) if vis('target_allocations') else None
+    line_chart_future = (chart_pool.submit(generate_line_chart, performance_chart_data)
+                         if vis('portfolio_overview') and performance_chart_data is not None else None)
+    donut_chart_future = chart_pool.submit(generate_donut_chart, summary_df) if vis('portfolio_overview') else None
+    chart_pool.shutdown(wait=False)
     
-    # --- HELPER 1: CLEAN TEXT HELPER FUNCTION FOR PDF INFO FROM data/info_for_pdf.xlsx ---
-    def clean_text(text):
-        """Replaces 'smart' punctuation with standard ASCII."""
-        if not isinstance(text, str):
-            return str(text)
-        
-        replacements = {
-            '\u2018': "'",  # Left single quote
-            '\u2019': "'",  # Right single quote
-            '\u201c': '"',  # Left double quote
-            '\u201d': '"',  # Right double quote
-            '\u2013': '-',  # En dash
-            '\u2014': '-',  # Em dash
-            '\u2026': '...',# Ellipsis
-        }
-        for original, replacement in replacements.items():
-            text = text.replace(original, replacement)
-        
-        # Final safety net: replace any remaining non-latin-1 chars with '?'
-        return text.encode('latin-1', 'replace').decode('latin-1')
-    
-    # --- HELPER 2: FORMAT DATE (YYYY-MM-DD -> January 13th, 2026) ---
+    # --- HELPER 1: FORMAT DATE (YYYY-MM-DD -> January 13th, 2026) ---
     def format_nice_date(date_str):
         try:
             # Convert string or datetime object to Timestamp
@@ -508,7 +553,7 @@ def write_portfolio_report(summary_df, holdings_df, key_statistics, total_metric
             return str(date_str) # Fallback if parsing fails
     # --------------------------------------------------------------------------------------
     
-    # --- HELPER 3: DISCLOSURE AT BOTTOM OF PAGE ---
+    # --- HELPER 2: DISCLOSURE AT BOTTOM OF PAGE ---
     def _disclosure_single_paragraph(text):
         """Turns disclosure copy into one flowing paragraph (no hard line breaks from source)."""
         if not isinstance(text, str):
@@ -532,7 +577,6 @@ def write_portfolio_report(summary_df, holdings_df, key_statistics, total_metric
     data_rep_date = format_nice_date(report_date) # Format WHEN GENERATED Report Date
     
     # COMMON STYLES
-    header_style = FontFace(size_pt=12, emphasis="BOLD", color=C_WHITE, fill_color=C_BLUE_LOGO)
     
     
     # Clean the account title for PDF display (strip custodian boilerplate)
@@ -553,7 +597,7 @@ def write_portfolio_report(summary_df, holdings_df, key_statistics, total_metric
 
     def _render_cover_page():
         """Shared layout for front and back cover pages."""
-        if text_logo_path and os.path.exists(text_logo_path):
+        if _logo_available(text_logo_path):
             logo_w = 46
             logo_x = (pdf.w - logo_w) / 2
             try: 
@@ -572,7 +616,7 @@ def write_portfolio_report(summary_df, holdings_df, key_statistics, total_metric
         pdf.set_y(start_y + 6)
         pdf.set_font('Carlito', 'B', 24); pdf.set_text_color(0, 0, 0)
         pdf.cell(0, 12, account_name, align='C', new_x="LMARGIN", new_y="NEXT")
-        pdf.set_font('Carlito', 'B', 18); pdf.set_text_color(0, 0, 0)
+        pdf.set_font('Carlito', 'B', 18)
         pdf.cell(0, 10, report_title, align='C', new_x="LMARGIN", new_y="NEXT")
         pdf.set_font('Carlito', '', 12); pdf.set_text_color(100, 100, 100)
         pdf.cell(0, 8, f"{title_rep_date}", align='C', new_x="LMARGIN", new_y="NEXT")
@@ -642,8 +686,7 @@ def write_portfolio_report(summary_df, holdings_df, key_statistics, total_metric
         side_margin = 55
         text_block_width = pdf.w - (side_margin *2)
         line_height = 6
-        lines = pdf.multi_cell(text_block_width, line_height, ips_text, dry_run=True, output="LINES")
-        num_lines = len(lines)
+        num_lines = _wrapped_line_count(pdf, text_block_width, line_height, ips_text)
         block_height = num_lines * line_height
         start_y = (pdf.h - block_height) / 2
         if start_y < 35: 
@@ -656,8 +699,6 @@ def write_portfolio_report(summary_df, holdings_df, key_statistics, total_metric
     #  ==========================================
     #   PAGE 4: TARGET ALLOCATIONS
     #  ==========================================
-    reg_name_style = FontFace(size_pt=12, emphasis=None, color=(0,0,0), fill_color=C_WHITE)
-    reg_data_style = FontFace(size_pt=12, emphasis=None, color=(0,0,0), fill_color=C_WHITE)
 
     if vis('target_allocations'):
         pdf.show_standard_header = True; pdf.header_text = "Target Allocations"; pdf.add_page()
@@ -670,24 +711,23 @@ def write_portfolio_report(summary_df, holdings_df, key_statistics, total_metric
                        width=190, 
                        line_height=8) as table:
             h = table.row()
-            h.cell("Category", style=header_style)
+            h.cell("Category", style=FF_HEADER)
             for t in ["Min", "Max", "Target", "Current", "Compliance Status"]: 
-                h.cell(t, style=header_style)
+                h.cell(t, style=FF_HEADER)
             pdf.set_draw_color(*C_GREY_BORDER)
-            for cat, v_min, v_max, v_tgt, v_cur in ips_rows:
+            for cat, v_min, v_max, v_tgt, v_cur, status in ips_rows:
                 r = table.row()
-                r.cell(cat, style=reg_name_style)
-                r.cell(f"{v_min:.1%}", style=reg_data_style, border="RIGHT")
-                r.cell(f"{v_max:.1%}", style=reg_data_style, border="RIGHT")
-                r.cell(f"{v_tgt:.1%}", style=reg_data_style, border="RIGHT")
-                r.cell(f"{v_cur:.1%}", style=reg_data_style, border="RIGHT")
-                status = "Compliant" if _ips_band_compliant(v_cur, v_min, v_max) else "Non-Compliant"
-                r.cell(status, style=reg_data_style)
+                r.cell(cat, style=FF_REGULAR)
+                r.cell(f"{v_min:.1%}", style=FF_REGULAR, border="RIGHT")
+                r.cell(f"{v_max:.1%}", style=FF_REGULAR, border="RIGHT")
+                r.cell(f"{v_tgt:.1%}", style=FF_REGULAR, border="RIGHT")
+                r.cell(f"{v_cur:.1%}", style=FF_REGULAR, border="RIGHT")
+                r.cell(status, style=FF_REGULAR)
                 
         pdf.ln(26)
         
         try:
-            ips_chart_img = generate_ips_chart(ips_rows)
+            ips_chart_img = ips_chart_future.result()
             if ips_chart_img:
                 chart_w = 265
                 legend_start_x = pdf.w - 125
@@ -716,7 +756,6 @@ def write_portfolio_report(summary_df, holdings_df, key_statistics, total_metric
                 chart_x = ((pdf.w - chart_w) / 2) - 10
                 chart_y = legend_y + 8 
                 pdf.image(ips_chart_img, x=chart_x, y=chart_y, w=chart_w)
-                os.remove(ips_chart_img)   
         except Exception as e:
             print(f"IPS Chart Error: {e}")
 
@@ -763,26 +802,25 @@ def write_portfolio_report(summary_df, holdings_df, key_statistics, total_metric
             line_height=line_height,
         ) as table:
             hdr = table.row()
-            hdr.cell("Account", style=header_style)
-            hdr.cell("Type", style=header_style)
-            hdr.cell("Beginning NAV", style=header_style)
-            hdr.cell("Ending NAV", style=header_style)
-            hdr.cell("Return", style=header_style)
+            hdr.cell("Account", style=FF_HEADER)
+            hdr.cell("Type", style=FF_HEADER)
+            hdr.cell("Beginning NAV", style=FF_HEADER)
+            hdr.cell("Ending NAV", style=FF_HEADER)
+            hdr.cell("Return", style=FF_HEADER)
             for br in consolidated_breakdown_rows:
                 row = table.row()
-                row.cell(clean_text(br.account_number), style=reg_name_style)
-                row.cell(clean_text(br.type_label), style=reg_name_style)
-                row.cell(f"${br.beginning_nav:,.0f}", style=reg_data_style)
-                row.cell(f"${br.ending_nav:,.0f}", style=reg_data_style)
-                row.cell(f"{br.return_pct:.2f}%", style=reg_data_style)
+                row.cell(clean_text(br.account_number), style=FF_REGULAR)
+                row.cell(clean_text(br.type_label), style=FF_REGULAR)
+                row.cell(f"${br.beginning_nav:,.0f}", style=FF_REGULAR)
+                row.cell(f"${br.ending_nav:,.0f}", style=FF_REGULAR)
+                row.cell(f"{br.return_pct:.2f}%", style=FF_REGULAR)
             if key_statistics:
-                total_style = FontFace(emphasis="BOLD", size_pt=12, fill_color=C_LIGHT_BG)
                 total_row = table.row()
-                total_row.cell("Total", style=total_style)
-                total_row.cell("", style=total_style)
-                total_row.cell(f"${key_statistics.get('BeginningNAV', 0.0):,.0f}", style=total_style)
-                total_row.cell(f"${key_statistics.get('EndingNAV', 0.0):,.0f}", style=total_style)
-                total_row.cell(f"{key_statistics.get('CumulativeReturn', 0.0) * 100:.2f}%", style=total_style)
+                total_row.cell("Total", style=FF_ROW_BOLD)
+                total_row.cell("", style=FF_ROW_BOLD)
+                total_row.cell(f"${key_statistics.get('BeginningNAV', 0.0):,.0f}", style=FF_ROW_BOLD)
+                total_row.cell(f"${key_statistics.get('EndingNAV', 0.0):,.0f}", style=FF_ROW_BOLD)
+                total_row.cell(f"{key_statistics.get('CumulativeReturn', 0.0) * 100:.2f}%", style=FF_ROW_BOLD)
         render_page_disclosure(pdf, DISCLOSURE_BREAKDOWN)
 
 
@@ -832,15 +870,14 @@ def write_portfolio_report(summary_df, holdings_df, key_statistics, total_metric
                            width=table_width, 
                            line_height=8) as table:
                 header = table.row()
-                header.cell("Category", style=header_style)
-                header.cell("Value", style=header_style)
+                header.cell("Category", style=FF_HEADER)
+                header.cell("Value", style=FF_HEADER)
                 row_order = ["Starting Value", "Mark-to-Market", "Deposits & Withdrawals", "Dividends", "Interest","Fees & Commissions", "Change in Interest Accruals", "Ending Value"]
                 for key in row_order:
                     val = breakdown.get(key, 0.0)
                     is_bold = key in ["Starting Value", "Ending Value"]
                     display_name = key if is_bold else f"      {key}"
-                    bg_color = C_LIGHT_BG if is_bold else C_WHITE
-                    style_row = FontFace(emphasis="BOLD" if is_bold else "", size_pt=12, fill_color=bg_color)
+                    style_row = FF_ROW_BOLD if is_bold else FF_ROW_PLAIN
                     r = table.row()
                     r.cell(display_name, style=style_row)
                     r.cell(f"${val:,.0f}", style=style_row)
@@ -864,20 +901,20 @@ def write_portfolio_report(summary_df, holdings_df, key_statistics, total_metric
             has_3y = data_span >= 365 * 3
             show_footnotes = not has_1y or not has_3y
 
-        if performance_chart_data is not None:
+        if line_chart_future is not None:
             try:
-                line_chart_img = generate_line_chart(performance_chart_data)
+                line_chart_img = line_chart_future.result()
                 if line_chart_img:
                     chart_title = "Portfolio Performance vs Benchmark"
                     pdf.set_font('Carlito', 'B', 12); pdf.set_text_color(0, 0, 0); pdf.cell(0, 9, chart_title, new_x="LMARGIN", new_y="NEXT")
-                    pdf.set_y(start_y+10); pdf.image(line_chart_img, w=165); os.remove(line_chart_img)
+                    pdf.set_y(start_y+10); pdf.image(line_chart_img, w=165)
             except Exception as e:
                 print(f"Performance Chart Error: {e}")
         try:
-            chart_img = generate_donut_chart(summary_df); 
+            chart_img = donut_chart_future.result()
             if chart_img: 
                 pdf.set_y(start_y); pdf.set_x(185); pdf.set_font('Carlito', 'B', 12); pdf.set_text_color(0, 0, 0); pdf.cell(0, 9, "Current Asset Allocation", new_x="LMARGIN", new_y="NEXT")
-                pdf.set_y(start_y+10); pdf.set_x(190); pdf.image(chart_img, w=95); os.remove(chart_img)
+                pdf.set_y(start_y+10); pdf.set_x(190); pdf.image(chart_img, w=95)
         except Exception as e:
             print(f"Asset Allocation Chart Error: {e}")
         
@@ -905,25 +942,23 @@ def write_portfolio_report(summary_df, holdings_df, key_statistics, total_metric
 
         with pdf.table(col_widths=col_widths, text_align=alignments, borders_layout="NONE", align="CENTER", width=table_width) as table:
             row1 = table.row()
-            row1.cell("Account", style=header_style, align="LEFT")
+            row1.cell("Account", style=FF_HEADER, align="LEFT")
             for k in keys:
-                row1.cell(headers_map.get(k, k), style=header_style, align="RIGHT")
+                row1.cell(headers_map.get(k, k), style=FF_HEADER, align="RIGHT")
             row = table.row()
             acct_str = account_title[:38] + "..." if len(account_title) > 40 else account_title
-            p5_style = FontFace(size_pt=12, fill_color=C_LIGHT_BG)
-            row.cell(acct_str, style=p5_style, align="LEFT")
+            row.cell(acct_str, style=FF_HIGHLIGHT, align="LEFT")
             for i, k in enumerate(keys): 
                 val = performance_windows.get(k) if performance_windows else None
                 b_style = "RIGHT" if k != "Inception" else "NONE"
-                row.cell(_perf_cell_text(k, val), style=p5_style, align="RIGHT", border=b_style)
+                row.cell(_perf_cell_text(k, val), style=FF_HIGHLIGHT, align="RIGHT", border=b_style)
             if benchmark_performance_windows:
                 row_bench = table.row()
-                p5_bench_style = FontFace(size_pt=12, emphasis="ITALICS", color=C_TEXT_GREY, fill_color=C_WHITE)
-                row_bench.cell("Benchmark", style=p5_bench_style)
+                row_bench.cell("Benchmark", style=FF_BENCH)
                 for i, k in enumerate(keys): 
                     val = benchmark_performance_windows.get(k)
                     b_style = "RIGHT" if k != "Inception" else "NONE"
-                    row_bench.cell(_perf_cell_text(k, val), style=p5_bench_style, align="RIGHT", border=b_style)
+                    row_bench.cell(_perf_cell_text(k, val), style=FF_BENCH, align="RIGHT", border=b_style)
 
         if show_footnotes:
             pdf.set_y(-40)
@@ -946,8 +981,9 @@ def write_portfolio_report(summary_df, holdings_df, key_statistics, total_metric
     # 2. Update Summary DF: Sum 'Other' values into 'Cash' row WITHOUT breaking sort order
     if not summary_df.empty:
         # Find the specific index for Cash and Other buckets
-        cash_indices = summary_df[(summary_df['Type'] == 'Bucket') & (summary_df['Name'] == 'Cash')].index
-        other_indices = summary_df[(summary_df['Type'] == 'Bucket') & (summary_df['Name'] == 'Other')].index
+        is_bucket = summary_df['Type'] == 'Bucket'
+        cash_indices = summary_df[is_bucket & (summary_df['Name'] == 'Cash')].index
+        other_indices = summary_df[is_bucket & (summary_df['Name'] == 'Other')].index
 
         # If both exist, merge 'Other' into 'Cash'
         if not cash_indices.empty and not other_indices.empty:
@@ -996,29 +1032,27 @@ def write_portfolio_report(summary_df, holdings_df, key_statistics, total_metric
         pdf.cell(0, 4, f"Reportings as of {data_rep_date}", new_x="LMARGIN", new_y="NEXT", align='L')
         pdf.ln(3)
         pdf.set_y(table_start_y)
-        bucket_style = FontFace(size_pt=12, emphasis="BOLD", color=(0,0,0), fill_color=C_LIGHT_BG)
-        bench_style = FontFace(size_pt=12, emphasis="ITALICS", color=C_TEXT_GREY, fill_color=C_WHITE)
         with pdf.table(col_widths=(60, 25, 30, 25), text_align=("LEFT", "RIGHT", "RIGHT", "RIGHT"), 
                        borders_layout="NONE", align="CENTER", width=table_width, line_height=8) as table:
             header = table.row()
-            header.cell("Asset Class", style=header_style, align="LEFT")
-            header.cell("Allocation", style=header_style, align="RIGHT")
-            header.cell("Ending Value", style=header_style, align="RIGHT")
-            header.cell(return_header, style=header_style, align="RIGHT")
+            header.cell("Asset Class", style=FF_HEADER, align="LEFT")
+            header.cell("Allocation", style=FF_HEADER, align="RIGHT")
+            header.cell("Ending Value", style=FF_HEADER, align="RIGHT")
+            header.cell(return_header, style=FF_HEADER, align="RIGHT")
             pdf.set_draw_color(*C_GREY_BORDER)
-            for _, row in summary_df.iterrows():
-                if row['Type'] == 'Bucket':
+            for row_type, name, alloc, mv, ret in summary_df[['Type', 'Name', 'Allocation', 'MarketValue', 'Return']].itertuples(index=False, name=None):
+                if row_type == 'Bucket':
                     r = table.row()
-                    r.cell(row['Name'], style=bucket_style)
-                    r.cell(f"{row['Allocation']:.2%}", style=bucket_style, border="RIGHT")
-                    r.cell(f"${row['MarketValue']:,.0f}", style=bucket_style, border="RIGHT")
-                    r.cell(f"{row['Return']:.2%}", style=bucket_style)
-                elif row['Type'] == 'Benchmark':
+                    r.cell(name, style=FF_BUCKET)
+                    r.cell(f"{alloc:.2%}", style=FF_BUCKET, border="RIGHT")
+                    r.cell(f"${mv:,.0f}", style=FF_BUCKET, border="RIGHT")
+                    r.cell(f"{ret:.2%}", style=FF_BUCKET)
+                elif row_type == 'Benchmark':
                     r = table.row()
-                    r.cell(row['Name'], style=bench_style)
-                    r.cell("", style=bench_style, border="RIGHT") 
-                    r.cell("", style=bench_style, border="RIGHT") 
-                    r.cell(f"{row['Return']:.2%}", style=bench_style)
+                    r.cell(name, style=FF_BENCH)
+                    r.cell("", style=FF_BENCH, border="RIGHT") 
+                    r.cell("", style=FF_BENCH, border="RIGHT") 
+                    r.cell(f"{ret:.2%}", style=FF_BENCH)
         render_page_disclosure(pdf, DISCLOSURE_ALLOCATION)
         
         
@@ -1029,77 +1063,86 @@ def write_portfolio_report(summary_df, holdings_df, key_statistics, total_metric
         pdf.show_standard_header = True; pdf.header_text = "Expanded Investment Performance by Allocation"; pdf.add_page()
         pdf.set_font('Carlito', 'B', 14); pdf.set_text_color(0, 0, 0); pdf.ln(2)
 
-        bucket_order = summary_df[summary_df['Type'] == 'Bucket']['Name'].unique().tolist()
-        sorter_map = {name: i for i, name in enumerate(bucket_order)}
-        holdings_df['sort_key'] = holdings_df['asset_class'].map(sorter_map).fillna(999)
-        sorted_holdings = holdings_df.sort_values(['sort_key', 'weight'], ascending=[True, False])
-        unique_buckets = sorted_holdings['asset_class'].unique()
-
-        bucket_bench_map = {}
-        current_bucket = None
-        for _, row in summary_df.iterrows():
-            if row['Type'] == 'Bucket': current_bucket = row['Name']
-            elif row['Type'] == 'Benchmark' and current_bucket: bucket_bench_map[current_bucket] = (row['Name'], row['Return'])
+        # Buckets follow the summary order; unlisted asset classes (-1) sort last
+        is_bucket = summary_df['Type'] == 'Bucket'
+        bucket_rows = summary_df[is_bucket].drop_duplicates('Name')  # first row wins per bucket
+        bucket_order = bucket_rows['Name']
+        bucket_returns = dict(zip(bucket_rows['Name'], bucket_rows['Return']))
+        sort_key = pd.Index(bucket_order).get_indexer(holdings_df['asset_class'])
+        sort_key[sort_key < 0] = len(bucket_order)
+        sorted_holdings = holdings_df.assign(sort_key=sort_key).sort_values(['sort_key', 'weight'], ascending=[True, False])
+
+        # Each Benchmark row belongs to the nearest Bucket row above it
+        owner_bucket = summary_df['Name'].where(is_bucket).ffill()
+        bench_mask = (summary_df['Type'] == 'Benchmark') & owner_bucket.notna()
+        bucket_bench_map = dict(zip(owner_bucket[bench_mask],
+                                    zip(summary_df.loc[bench_mask, 'Name'], summary_df.loc[bench_mask, 'Return'])))
 
         col_widths = (25, 145, 30, 45, 30)
-        header_style = FontFace(size_pt=12, emphasis="BOLD", color=C_WHITE, fill_color=C_BLUE_LOGO)
-        bucket_name_style = FontFace(size_pt=12, emphasis="BOLD", color=(0,0,0), fill_color=C_LIGHT_BG)
-        bucket_data_style = FontFace(size_pt=12, emphasis="BOLD", color=(0,0,0), fill_color=C_LIGHT_BG)
-        bench_name_style  = FontFace(size_pt=12, emphasis="ITALICS", color=C_TEXT_GREY, fill_color=C_WHITE)
-        bench_data_style  = FontFace(size_pt=12, emphasis="ITALICS", color=C_TEXT_GREY, fill_color=C_WHITE)
-        reg_name_style = FontFace(size_pt=12, emphasis=None, color=(0,0,0), fill_color=C_WHITE)
-        reg_data_style = FontFace(size_pt=12, emphasis=None, color=(0,0,0), fill_color=C_WHITE)
         pdf.set_font('Carlito', '', 12)
         page_start = pdf.page
         
-        with pdf.table(col_widths=col_widths, 
-                       text_align=("LEFT", "LEFT", "RIGHT", "RIGHT", "RIGHT"),
-                       borders_layout="NONE", align="LEFT", width=275) as table:
-            h_row = table.row()
-            headers = ["Ticker", "Name", "Allocation", "Ending Value", return_header] # Add back "Cost Basis" here
-            for h in headers: h_row.cell(h, style=header_style)
-            for bucket in unique_buckets:
-                subset = sorted_holdings[sorted_holdings['asset_class'] == bucket]
-                sum_value = subset['raw_value'].sum()
-                sum_alloc = subset['weight'].sum()
-                bk_row = summary_df[(summary_df['Type']=='Bucket') & (summary_df['Name']==bucket)]
-                sum_ret = bk_row['Return'].iloc[0] if not bk_row.empty else 0.0
-                bucket_ret_str = f"{sum_ret:.2%}"
-                s_row = table.row()
-                s_row.cell(bucket, colspan=2, style=bucket_name_style, align="LEFT")
+        # Pre-format the display columns once rather than per row inside the table loop.
+        # USD shows as Settled Cash with its contribution; ACCRUALS carries no return.
+        tickers = sorted_holdings['ticker'].map(str)
+        is_usd, is_accr = tickers == "USD", tickers == "ACCRUALS"
+        names = sorted_holdings['official_name'].map(str) if 'official_name' in sorted_holdings else pd.Series("", index=sorted_holdings.index)
+        names = names.mask(is_usd, "Settled Cash").mask(is_accr, "Interest Accruals")
+        rets = sorted_holdings['cumulative_return'].map('{:.2%}'.format)
+        if 'contribution' in sorted_holdings:
+            contrib = pd.to_numeric(sorted_holdings['contribution'], errors='coerce')
+            rets = rets.mask(is_usd & contrib.notna(), contrib.map('{:.2%}'.format))
+        sorted_holdings['_ticker_s'] = tickers.mask(is_accr, "Accruals")
+        sorted_holdings['_name_s'] = names.where(names.str.len() <= _HOLDING_NAME_MAX_CHARS,
+                                                 names.str.slice(0, _HOLDING_NAME_MAX_CHARS - 2) + "...")
+        sorted_holdings['_weight_s'] = sorted_holdings['weight'].map('{:.2%}'.format)
+        sorted_holdings['_value_s'] = sorted_holdings['raw_value'].map('${:,.0f}'.format)
+        sorted_holdings['_ret_s'] = rets.mask(is_accr, "\u2014")
+
+        headers = ["Ticker", "Name", "Allocation", "Ending Value", return_header] # Add back "Cost Basis" here
+        # Flatten the book into rows: each bucket's summary row, its benchmark, then its holdings.
+        # Holdings are already in bucket order, so one unsorted groupby walks each bucket once.
+        book_rows = []
+        for bucket, subset in sorted_holdings.groupby('asset_class', sort=False):
+            book_rows.append(('bucket', (bucket, f"{subset['weight'].sum():.2%}", f"${subset['raw_value'].sum():,.0f}",
+                                         f"{bucket_returns.get(bucket, 0.0):.2%}")))
+            bench_info = bucket_bench_map.get(bucket)
+            if bench_info:
+                book_rows.append(('bench', (bench_info[0], f"{bench_info[1]:.2%}")))
+            book_rows.extend(('holding', cells) for cells in
+                             subset[['_ticker_s', '_name_s', '_weight_s', '_value_s', '_ret_s']].itertuples(index=False, name=None))
+
+        # One grouped table for the whole book, with bucket rows as section headers. Very large
+        # books are split into fixed-size tables to keep fpdf2's layout pass bounded.
+        chunk_rows = _HOLDINGS_TABLE_CHUNK if len(sorted_holdings) > _HOLDINGS_TABLE_CHUNK_THRESHOLD else max(len(book_rows), 1)
+        for start in range(0, max(len(book_rows), 1), chunk_rows):
+            with pdf.table(col_widths=col_widths, 
+                           text_align=("LEFT", "LEFT", "RIGHT", "RIGHT", "RIGHT"),
+                           borders_layout="NONE", align="LEFT", width=275) as table:
+                h_row = table.row()
+                for h in headers: h_row.cell(h, style=FF_HEADER)
                 pdf.set_draw_color(*C_GREY_BORDER)
-                s_row.cell(f"{sum_alloc:.2%}", style=bucket_data_style, border="RIGHT")
-                s_row.cell(f"${sum_value:,.0f}", style=bucket_data_style, border="RIGHT")
-                s_row.cell(bucket_ret_str, style=bucket_data_style)
-                bench_info = bucket_bench_map.get(bucket)
-                if bench_info:
-                    b_name, b_ret = bench_info
-                    b_row = table.row()
-                    b_row.cell(b_name, colspan=2, style=bench_name_style, align="LEFT")
-                    b_row.cell("", style=bench_data_style, border="RIGHT")
-                    b_row.cell("", style=bench_data_style, border="RIGHT")
-                    b_row.cell(f"{b_ret:.2%}", style=bench_data_style)
-                for _, pos in subset.iterrows():
+                for kind, cells in book_rows[start:start + chunk_rows]:
                     r = table.row()
-                    raw_ticker = str(pos['ticker'])
-                    if raw_ticker == "USD":
-                        display_ticker = "USD"
-                        name_str = "Settled Cash"
-                        c = pos.get("contribution")
-                        ret_str = f"{float(c):.2%}" if c is not None and pd.notna(c) else f"{pos['cumulative_return']:.2%}"
-                    elif raw_ticker == "ACCRUALS":
-                        display_ticker = "Accruals"; name_str = "Interest Accruals"; ret_str = "\u2014"
+                    if kind == 'bucket':
+                        bucket, alloc_str, value_str, ret_str = cells
+                        r.cell(bucket, colspan=2, style=FF_BUCKET, align="LEFT")
+                        r.cell(alloc_str, style=FF_BUCKET, border="RIGHT")
+                        r.cell(value_str, style=FF_BUCKET, border="RIGHT")
+                        r.cell(ret_str, style=FF_BUCKET)
+                    elif kind == 'bench':
+                        b_name, b_ret_str = cells
+                        r.cell(b_name, colspan=2, style=FF_BENCH, align="LEFT")
+                        r.cell("", style=FF_BENCH, border="RIGHT")
+                        r.cell("", style=FF_BENCH, border="RIGHT")
+                        r.cell(b_ret_str, style=FF_BENCH)
                     else:
-                        display_ticker = raw_ticker
-                        ret_str = f"{pos['cumulative_return']:.2%}"
-                        name_str = str(pos.get('official_name', ''))
-                    if len(name_str) > 60: name_str = name_str[:58] + "..."
-                    r.cell(display_ticker, style=reg_name_style)
-                    r.cell(name_str, style=reg_name_style)
-                    r.cell(f"{pos['weight']:.2%}", style=reg_data_style, border="RIGHT")
-                    r.cell(f"${pos['raw_value']:,.0f}", style=reg_data_style, border="RIGHT")
-                    r.cell(ret_str, style=reg_data_style)
-
+                        display_ticker, name_str, weight_str, value_str, ret_str = cells
+                        r.cell(display_ticker, style=FF_REGULAR)
+                        r.cell(name_str, style=FF_REGULAR)
+                        r.cell(weight_str, style=FF_REGULAR, border="RIGHT")
+                        r.cell(value_str, style=FF_REGULAR, border="RIGHT")
+                        r.cell(ret_str, style=FF_REGULAR)
         page_end = pdf.page
         for pg in range(page_start, page_end + 1):
             pdf.page = pg
@@ -1168,17 +1211,16 @@ def write_portfolio_report(summary_df, holdings_df, key_statistics, total_metric
             with pdf.table(col_widths=(65, 65), text_align=("LEFT", "RIGHT"), borders_layout="NONE", 
                            align="LEFT", width=table_width, line_height=8) as table:
                 header = table.row()
-                header.cell("Risk Metric", style=header_style)
-                header.cell("Value", style=header_style)
+                header.cell("Risk Metric", style=FF_HEADER)
+                header.cell("Value", style=FF_HEADER)
                 for label, val, fmt, is_header in rows:
                     if is_header:
-                        display_name = label; val_str = ""; bg_color = C_LIGHT_BG; font_style = "BOLD"
+                        display_name = label; val_str = ""; style_row = FF_ROW_BOLD
                     else:
-                        display_name = f"      {label}"; bg_color = C_WHITE; font_style = ""
+                        display_name = f"      {label}"; style_row = FF_ROW_PLAIN
                         if fmt == 'percent': val_str = f"{val:.2f}%"
                         elif fmt == 'float': val_str = f"{val:.2f}"
                         else: val_str = str(val)
-                    style_row = FontFace(emphasis=font_style, size_pt=12, fill_color=bg_color)
                     r = table.row()
                     r.cell(display_name, style=style_row)
                     r.cell(val_str, style=style_row)
@@ -1226,8 +1268,7 @@ def write_portfolio_report(summary_df, holdings_df, key_statistics, total_metric
 
         def _para_height(text):
             """Estimate rendered height of a paragraph using fpdf's own line-wrap logic."""
-            lines = pdf.multi_cell(col_width, line_h, text, dry_run=True, output="LINES")
-            return len(lines) * line_h + para_gap
+            return _wrapped_line_count(pdf, col_width, line_h, text) * line_h + para_gap
 
         def _col_max_y():
             return pdf.h - footer_clearance
@@ -1308,8 +1349,6 @@ def write_portfolio_report(summary_df, holdings_df, key_statistics, total_metric
     #   IMPORTANT INFORMATION AND DISCLOSURES
     #  ==========================================
     if vis('disclosures'):
-        discl_header_style = FontFace(size_pt=8, emphasis="BOLD", color=C_WHITE, fill_color=C_BLUE_LOGO)
-        discl_row_style = FontFace(size_pt=8, emphasis="", color=(0, 0, 0), fill_color=C_WHITE)
 
         def _discl_section_heading(title):
             pdf.set_font('Carlito', 'B', 11)
@@ -1339,21 +1378,15 @@ def write_portfolio_report(summary_df, holdings_df, key_statistics, total_metric
         else:
             # Start disclosures on its own page only when there is no General Disclosures block above.
             _disclosures_new_page()
-        # _discl_section_heading("Capital Market Assumptions")
-        # pdf.set_font('Carlito', 'I', 9); pdf.set_text_color(120, 120, 120)
-        # pdf.cell(0, 4, "(Millcreek placeholder)", new_x="LMARGIN", new_y="NEXT", align='L'); pdf.ln(5)
-        # _discl_section_heading("Forward Looking Statements")
-        # pdf.set_font('Carlito', 'I', 9); pdf.set_text_color(120, 120, 120)
-        # pdf.cell(0, 4, "(Millcreek placeholder)", new_x="LMARGIN", new_y="NEXT", align='L'); pdf.ln(5)
         _discl_section_heading("Benchmark Definitions")
         pdf.set_font('Carlito', '', 8)
         with pdf.table(col_widths=(60, 210), text_align=("LEFT", "LEFT"), borders_layout="HORIZONTAL_LINES",
                        align="LEFT", width=270, line_height=4) as table:
             h = table.row()
-            h.cell("Benchmark", style=discl_header_style); h.cell("Description", style=discl_header_style)
+            h.cell("Benchmark", style=FF_DISCL_HEADER); h.cell("Description", style=FF_DISCL_HEADER)
             for bench_name, bench_desc in BENCHMARK_DEFINITIONS:
                 r = table.row()
-                r.cell(bench_name, style=discl_row_style); r.cell(bench_desc, style=discl_row_style)
+                r.cell(bench_name, style=FF_DISCL_ROW); r.cell(bench_desc, style=FF_DISCL_ROW)
         pdf.ln(5)
         def _definitions_and_calculations_table():
             _discl_section_heading("Definitions & Calculations")
@@ -1375,15 +1408,14 @@ def write_portfolio_report(summary_df, holdings_df, key_statistics, total_metric
                 ("Beta: Quality (QUAL)", "Sensitivity to the quality factor (MSCI USA Quality).", "Regression slope vs. factor"),
                 ("Beta: Momentum (MTUM)", "Sensitivity to the momentum factor (MSCI USA Momentum).", "Regression slope vs. factor"),
             ]
-            risk_calc_style = FontFace(size_pt=8, emphasis="ITALICS", color=(80, 80, 80), fill_color=C_WHITE)
             pdf.set_font('Carlito', '', 8)
             with pdf.table(col_widths=(50, 120, 100), text_align=("LEFT", "LEFT", "LEFT"), borders_layout="HORIZONTAL_LINES",
                            align="LEFT", width=270, line_height=4) as table:
                 h = table.row()
-                h.cell("Metric", style=discl_header_style); h.cell("Definition", style=discl_header_style); h.cell("Calculation", style=discl_header_style)
+                h.cell("Metric", style=FF_DISCL_HEADER); h.cell("Definition", style=FF_DISCL_HEADER); h.cell("Calculation", style=FF_DISCL_HEADER)
                 for metric, definition, calc in metric_definitions:
                     r = table.row()
-                    r.cell(metric, style=discl_row_style); r.cell(definition, style=discl_row_style); r.cell(calc, style=risk_calc_style)
+                    r.cell(metric, style=FF_DISCL_ROW); r.cell(definition, style=FF_DISCL_ROW); r.cell(calc, style=FF_DISCL_CALC)
 
         def _disclosures_copyright_footer():
             pdf.ln(2)
@@ -1401,11 +1433,10 @@ def write_portfolio_report(summary_df, holdings_df, key_statistics, total_metric
                 with pdf.table(col_widths=(50, 220), text_align=("LEFT", "LEFT"), borders_layout="HORIZONTAL_LINES",
                                align="LEFT", width=270, line_height=4) as table:
                     h = table.row()
-                    h.cell("Type", style=discl_header_style); h.cell("Note", style=discl_header_style)
-                    note_style = FontFace(size_pt=8, emphasis="", color=(0, 0, 0), fill_color=C_WHITE)
+                    h.cell("Type", style=FF_DISCL_HEADER); h.cell("Note", style=FF_DISCL_HEADER)
                     for _, row in notes_df.iterrows():
                         r = table.row()
-                        r.cell(str(row.get('Type', '')), style=note_style); r.cell(str(row.get('Note', '')), style=note_style)
+                        r.cell(str(row.get('Type', '')), style=FF_DISCL_ROW); r.cell(str(row.get('Note', '')), style=FF_DISCL_ROW)
                 _disclosures_copyright_footer()
         else:
             with pdf.unbreakable():
@@ -1427,5 +1458,4 @@ def write_portfolio_report(summary_df, holdings_df, key_statistics, total_metric
         output_path = output_path.replace('.xlsx', '.pdf')
     
     pdf.output(output_path)
-    if os.path.exists("temp_chart.png"): os.remove("temp_chart.png")
     print(f"   > SUCCESS: PDF saved to {output_path}")
\ No newline at end of file
@@ -1,57 +1,84 @@
 import pandas as pd
+import numpy as np
 import datetime
 
+_MONEY_NOISE = str.maketrans('', '', ',$')  # thousands separators and currency signs
+
+# Trailing-window offsets, built once (other "<n>Y" / "<n>M" windows are parsed on demand)
+_WINDOW_OFFSETS = {
+    '1M': pd.DateOffset(months=1),
+    '3M': pd.DateOffset(months=3),
+    '6M': pd.DateOffset(months=6),
+    '1Y': pd.DateOffset(years=1),
+    '3Y': pd.DateOffset(years=3),
+    '5Y': pd.DateOffset(years=5),
+}
+
 def get_cumulative_index(returns_df: pd.DataFrame, start_value: float = 100.0) -> pd.DataFrame:
     """Converts a Series/DataFrame of Percentage Returns into a Price Index."""
     if returns_df.empty: return pd.DataFrame()
-    clean_returns = returns_df.fillna(0.0)
-    growth_factors = (1 + clean_returns).cumprod()
-    return start_value * growth_factors
+    # One float buffer, filled/compounded/scaled in place (no 1+r and cumprod temporaries)
+    growth = returns_df.to_numpy(dtype=float, copy=True)
+    growth[np.isnan(growth)] = 0.0
+    growth += 1.0
+    np.cumprod(growth, axis=0, out=growth)
+    growth *= start_value
+    if isinstance(returns_df, pd.Series): return pd.Series(growth, index=returns_df.index, name=returns_df.name)
+    return pd.DataFrame(growth, index=returns_df.index, columns=returns_df.columns)
+
+def _window_start_date(window: str, end_date):
+    """Start date for a trailing window label (YTD, 3M, 1Y, ...). None means the full history."""
+    window = window.upper()
+    if window == "YTD": return pd.Timestamp(year=end_date.year, month=1, day=1)
+    if window in _WINDOW_OFFSETS: return end_date - _WINDOW_OFFSETS[window]
+    if window.endswith('Y') and window[:-1].isdigit(): return end_date - pd.DateOffset(years=int(window[:-1]))
+    if window.endswith('M') and window[:-1].isdigit(): return end_date - pd.DateOffset(months=int(window[:-1]))
+    return None  # INCEPTION (or unrecognised)
+
+def get_cumulative_returns(series: pd.Series, windows) -> dict:
+    """Calculates the total return over several windows of one price series. Returns {window: return}."""
+    if series is None or series.empty: return {w: 0.0 for w in windows}
+    # Only clean when needed: callers usually pass an already sorted, NaN-free price series
+    if series.hasnans: series = series.dropna()
+    if not series.index.is_monotonic_increasing: series = series.sort_index()
+    if not isinstance(series.index, pd.DatetimeIndex): return {w: 0.0 for w in windows}
+
+    prices = series.to_numpy(dtype=float)
+    first_price, end_price = prices[0], prices[-1]
+    start_dates = {w: _window_start_date(w, series.index[-1]) for w in windows}
+    results = {w: (end_price / first_price) - 1.0 for w, d in start_dates.items() if d is None}
+
+    dated = [w for w, d in start_dates.items() if d is not None]
+    if dated:
+        # Last price on/before each start, all windows in one binary search (series is sorted and
+        # NaN-free, so this matches asof()); starts before the first date clamp to the first price
+        pos = series.index.searchsorted(pd.DatetimeIndex([start_dates[w] for w in dated]), side='right') - 1
+        for w, start_price in zip(dated, prices[np.maximum(pos, 0)]):
+            if start_price == 0: start_price = first_price
+            results[w] = (end_price / start_price) - 1.0
+    return {w: results[w] for w in windows}
 
 def get_cumulative_return(series: pd.Series, window: str) -> float:
     """Calculates the total return over a specific window."""
-    if series is None or series.empty: return 0.0
-    series = series.dropna().sort_index()
-    if not isinstance(series.index, pd.DatetimeIndex): return 0.0
-        
-    end_price = float(series.iloc[-1])
-    end_date = series.index[-1]
-    
-    start_date = None
-    window = window.upper()
-    
-    if window == "INCEPTION":
-        start_price = float(series.iloc[0])
-        return (end_price / start_price) - 1.0
-    elif window == "YTD":
-        start_date = pd.Timestamp(year=end_date.year, month=1, day=1)
-    elif window.endswith('Y') and window[:-1].isdigit():
-        years = int(window[:-1])
-        start_date = end_date - pd.DateOffset(years=years)
-    elif window.endswith('M') and window[:-1].isdigit():
-        months = int(window[:-1])
-        start_date = end_date - pd.DateOffset(months=months)
-    else:
-        start_price = float(series.iloc[0])
-        return (end_price / start_price) - 1.0
-
-    if start_date < series.index[0]: start_date = series.index[0]
-    start_price = series.asof(start_date)
-    
-    if pd.isna(start_price) or start_price == 0: start_price = float(series.iloc[0])
-    return (end_price / start_price) - 1.0
+    return get_cumulative_returns(series, [window])[window]
 
 def calculate_nav_performance(change_in_nav_df: pd.DataFrame) -> dict:
     """Calculates the Official NAV Return based on the 'Change in NAV' section."""
     default_res = {'NAV': 0.0, 'Return': 0.0, 'Breakdown': {}}
     if change_in_nav_df is None or change_in_nav_df.empty: return default_res
 
+    # Field Name -> Field Value, built once (first row wins for repeated names)
+    try:
+        names = change_in_nav_df['Field Name'].astype(str).str.strip()
+        field_values = dict(zip(names.iloc[::-1], change_in_nav_df['Field Value'].iloc[::-1]))
+    except Exception:
+        field_values = {}
+
     def parse_val(field_name):
         try:
-            row = change_in_nav_df[change_in_nav_df['Field Name'].astype(str).str.strip() == field_name]
-            if row.empty: return 0.0
-            val_str = row['Field Value'].iloc[0]
-            clean = str(val_str).replace(',', '').replace('$', '').strip()
+            if field_name not in field_values: return 0.0
+            val_str = field_values[field_name]
+            clean = str(val_str).translate(_MONEY_NOISE).strip()
             if clean.startswith('(') and clean.endswith(')'): clean = '-' + clean[1:-1]
             return float(clean)
         except: return 0.0
@@ -82,14 +109,19 @@ def calculate_period_returns(daily_nav_df, report_date_str):
     
     if daily_nav_df.empty: return results, quarter_label
     
-    df = daily_nav_df.copy()
-    df['date'] = pd.to_datetime(df['date'])
-    df = df.sort_values('date')
+    dates = daily_nav_df['date']
+    if pd.api.types.is_datetime64_any_dtype(dates) and dates.is_monotonic_increasing:
+        df = daily_nav_df  # already parsed and sorted (the usual case); only read below
+    else:
+        df = daily_nav_df.copy()
+        if not pd.api.types.is_datetime64_any_dtype(df['date']):
+            df['date'] = pd.to_datetime(df['date'])
+        df = df.sort_values('date')
     
     current_date = pd.to_datetime(report_date_str)
     
-    # Filter to report date
-    df = df[df['date'] <= current_date]
+    # Filter to report date (dates are sorted, NaT last, so this is a prefix)
+    df = df.iloc[:df['date'].searchsorted(current_date, side='right')]
     if df.empty: return results, quarter_label
 
     end_val = df.iloc[-1]['nav']
@@ -101,35 +133,32 @@ def calculate_period_returns(daily_nav_df, report_date_str):
     quarter_label = f"Q{q_num} {current_date.year}"
 
     # --- Helper Calculation ---
-    def get_nav_at(target_date):
-        if target_date < df.iloc[0]['date']: return df.iloc[0]['nav']
-        subset = df[df['date'] <= target_date]
-        if subset.empty: return None
-        return subset.iloc[-1]['nav']
-
     def calc(start, end):
         if start and start != 0: return (end / start) - 1.0
         return None
 
     # Define Dates
-    d_1m = current_date - pd.DateOffset(months=1)
-    d_3m = current_date - pd.DateOffset(months=3)
-    d_6m = current_date - pd.DateOffset(months=6)
-    d_ytd = datetime.datetime(current_date.year, 1, 1)
-    d_1y  = current_date - pd.DateOffset(years=1)
-    d_3y  = current_date - pd.DateOffset(years=3)
+    window_starts = {
+        '1M':  current_date - _WINDOW_OFFSETS['1M'],
+        '3M':  current_date - _WINDOW_OFFSETS['3M'],
+        '6M':  current_date - _WINDOW_OFFSETS['6M'],
+        'YTD': datetime.datetime(current_date.year, 1, 1),
+        '1Y':  current_date - _WINDOW_OFFSETS['1Y'],
+        '3Y':  current_date - _WINDOW_OFFSETS['3Y'],
+    }
+
+    # Start NAV = last NAV on/before each window start. Dates are sorted, so all windows are one
+    # batched binary search; starts before the first date clamp to the first NAV.
+    start_pos = pd.DatetimeIndex(df['date']).searchsorted(pd.DatetimeIndex(list(window_starts.values())), side='right') - 1
+    start_navs = df['nav'].to_numpy()[np.maximum(start_pos, 0)]
 
     # --- Calculate Returns ---
     # Period = Full range of the provided CSV (Matches "Change in NAV" timeline)
     # But displayed as "Q{x} {Year}"
     results['Period']    = calc(start_file_val, end_val)
     
-    results['1M']        = calc(get_nav_at(d_1m), end_val)
-    results['3M']        = calc(get_nav_at(d_3m), end_val)
-    results['6M']        = calc(get_nav_at(d_6m), end_val)
-    results['YTD']       = calc(get_nav_at(d_ytd), end_val)
-    results['1Y']        = calc(get_nav_at(d_1y), end_val)
-    results['3Y']        = calc(get_nav_at(d_3y), end_val)
+    for window, start_nav in zip(window_starts, start_navs):
+        results[window] = calc(start_nav, end_val)
     results['Inception'] = calc(df.iloc[0]['nav'], end_val)
     
     return results, quarter_label
@@ -142,15 +171,15 @@ def calculate_composite_benchmark_return(benchmark_returns_df: pd.DataFrame, wei
     """
     if benchmark_returns_df.empty: return pd.Series(dtype=float)
     
-    # Initialize with zeros aligned to the index
-    composite_series = pd.Series(0.0, index=benchmark_returns_df.index)
+    # Constituents missing from the fetched data contribute nothing (same as a zero weight)
+    tickers = [t for t in weights if t in benchmark_returns_df.columns]
+    if not tickers: return pd.Series(0.0, index=benchmark_returns_df.index)
     
-    for ticker, weight in weights.items():
-        if ticker in benchmark_returns_df.columns:
-            # Fill NaNs with 0.0 to allow calculation, though usually data should be aligned
-            composite_series += benchmark_returns_df[ticker].fillna(0.0) * weight
-            
-    return composite_series
+    # One (days x constituents) @ (constituents,) product instead of a weighted add per ticker.
+    # Fill NaNs with 0.0 to allow calculation, though usually data should be aligned
+    returns = benchmark_returns_df[tickers].fillna(0.0).to_numpy(dtype=float)
+    w = np.array([weights[t] for t in tickers], dtype=float)
+    return pd.Series(returns @ w, index=benchmark_returns_df.index)
 
 
 def prepare_chart_data(daily_nav_df, benchmark_series: pd.Series, benchmark_name: str = "Benchmark"):
@@ -160,14 +189,15 @@ def prepare_chart_data(daily_nav_df, benchmark_series: pd.Series, benchmark_name
     """
     if daily_nav_df.empty or benchmark_series.empty: return None
     
-    # 1. Prepare Portfolio Data
-    df_port = daily_nav_df.copy()
-    df_port['date'] = pd.to_datetime(df_port['date'])
+    # 1. Prepare Portfolio Data (only the columns the chart uses)
+    df_port = daily_nav_df[['date', 'nav']].copy()
+    if not pd.api.types.is_datetime64_any_dtype(df_port['date']):
+        df_port['date'] = pd.to_datetime(df_port['date'])
     df_port = df_port.sort_values('date')
     
-    # Calculate Cumulative Return for Portfolio
-    start_nav = df_port.iloc[0]['nav']
-    df_port['Cumulative Return'] = (df_port['nav'] / start_nav) - 1.0
+    # Calculate Cumulative Return for Portfolio: NAV relative to the first NAV (no pct_change/cumprod round trip)
+    port_nav = df_port['nav'].to_numpy(dtype=float)
+    port_cumulative = (port_nav / port_nav[0]) - 1.0
     
     # 2. Prepare Benchmark Data
     # Convert benchmark DAILY returns to CUMULATIVE returns
@@ -175,28 +205,22 @@ def prepare_chart_data(daily_nav_df, benchmark_series: pd.Series, benchmark_name
     start_date = df_port['date'].min()
     end_date = df_port['date'].max()
     
-    bench_subset = benchmark_series[start_date:end_date].copy()
+    bench_subset = benchmark_series[start_date:end_date]
     
     if bench_subset.empty: return None
 
-    # Calculate Growth of $1
-    bench_growth = (1 + bench_subset).cumprod()
-    # Normalize to start at 0%
-    bench_cumulative = bench_growth - 1.0
-    
-    # Create DataFrame for Benchmark
-    df_bench = pd.DataFrame({
-        'date': bench_cumulative.index,
-        'Cumulative Return': bench_cumulative.values
+    # Calculate Growth of $1, normalized to start at 0% (the benchmark arrives as returns, so it must compound).
+    # Compounded on the raw array; missing days stay NaN and are skipped, as Series.cumprod does.
+    bench_returns = bench_subset.to_numpy(dtype=float)
+    missing = np.isnan(bench_returns)
+    bench_cumulative = np.cumprod(np.where(missing, 1.0, 1.0 + bench_returns)) - 1.0
+    bench_cumulative[missing] = np.nan
+    
+    # 3. Combine: one long-format frame (portfolio rows, then benchmark rows) built directly
+    final_df = pd.DataFrame({
+        'date': pd.DatetimeIndex(df_port['date']).append(bench_subset.index),
+        'Cumulative Return': np.concatenate([port_cumulative, bench_cumulative]),
+        'Series': ['Portfolio'] * len(port_cumulative) + [benchmark_name] * len(bench_cumulative), # Use the dynamic name
     })
     
-    # 3. Rename Columns for Merging
-    df_port = df_port[['date', 'Cumulative Return']].copy()
-    df_port['Series'] = 'Portfolio'
-    
-    df_bench['Series'] = benchmark_name # Use the dynamic name
-    
-    # 4. Combine
-    final_df = pd.concat([df_port, df_bench], ignore_index=True)
-    
     return final_df
\ No newline at end of file
@@ -1,7 +1,11 @@
 import pandas as pd
 import numpy as np
 import yfinance as yf
-from scipy import stats
+import datetime
+from yf_loader import download_cached, disk_cache_get, disk_cache_put
+
+# date -> fetched ^IRX rate, so a batch run asks Yahoo once per day (fallbacks are not cached)
+_RF_RATE_CACHE = {}
 
 
 def get_live_risk_free_rate(default_rate=0.04):
@@ -9,6 +13,13 @@ def get_live_risk_free_rate(default_rate=0.04):
     Fetches the current yield of the 13-Week Treasury Bill (^IRX) from Yahoo.
     Returns a float (e.g., 4.25% -> 0.0425).
     """
+    today = datetime.date.today()
+    if today in _RF_RATE_CACHE:
+        return _RF_RATE_CACHE[today]
+    cached = disk_cache_get(('rf_rate', '^IRX'))
+    if cached is not None:
+        _RF_RATE_CACHE[today] = cached
+        return cached
     try:
         # ^IRX: Yahoo ticker for 13-Week Treasury Bill Yield
         ticker = yf.Ticker("^IRX")
@@ -21,6 +32,8 @@ def get_live_risk_free_rate(default_rate=0.04):
             latest_yield = hist['Close'].iloc[-1]
             rf_decimal = latest_yield / 100.0
             print(f"   > Fetched Live Risk-Free Rate: {rf_decimal:.2%}")
+            _RF_RATE_CACHE[today] = rf_decimal
+            disk_cache_put(('rf_rate', '^IRX'), rf_decimal)
             return rf_decimal
             
     except Exception as e:
@@ -52,28 +65,42 @@ def calculate_portfolio_risk(daily_nav_df, benchmark_series, rf_rate=None):
         rf_rate = get_live_risk_free_rate(default_rate=0.04)
             
     # 1. Prepare Portfolio Returns
-    df = daily_nav_df.copy()
-    df['date'] = pd.to_datetime(df['date'])
-    df = df.sort_values('date').set_index('date')
+    df = daily_nav_df
+    dates = df['date']
+    if not (pd.api.types.is_datetime64_any_dtype(dates) and dates.is_monotonic_increasing):
+        # main passes parsed, sorted dates; anything else is copied, parsed and sorted first
+        df = df.copy()
+        if not pd.api.types.is_datetime64_any_dtype(df['date']):
+            df['date'] = pd.to_datetime(df['date'])
+        df = df.sort_values('date')
     
-    port_returns = df['nav'].pct_change().dropna()
+    port_returns = df['nav'].set_axis(pd.DatetimeIndex(df['date'])).pct_change().dropna()
     
     # 2. Align with Main Benchmark (for Idiosyncratic Risk)
-    combined = pd.concat([port_returns, benchmark_series], axis=1, join='inner').dropna()
-    
-    if not combined.empty:
-        combined.columns = ['Portfolio', 'Benchmark']
-        y = combined['Portfolio']
-        x = combined['Benchmark']
-        
+    # Shared dates only, then one NaN mask over both arrays (no combined frame)
+    common = port_returns.index.intersection(benchmark_series.index)
+    y = port_returns.reindex(common).to_numpy(dtype=float)
+    x = benchmark_series.reindex(common).to_numpy(dtype=float)
+    valid = ~(np.isnan(y) | np.isnan(x))
+    y, x = y[valid], x[valid]
+    
+    if len(y):
         # --- A. IDIOSYNCRATIC RISK ---
-        slope, intercept, r_value, p_value, std_err = stats.linregress(x, y)
-        predicted = intercept + slope * x
-        residuals = y - predicted
-        
-        # Annualize Std Dev of Residuals
-        metrics['Idiosyncratic Risk'] = residuals.std() * np.sqrt(252)
-        metrics['R-Squared (vs Bench)'] = r_value**2
+        # Least-squares fit of portfolio on benchmark from centred sums (same fit as linregress)
+        x_dev = x - x.mean()
+        y_dev = y - y.mean()
+        ss_x, ss_y, ss_xy = x_dev @ x_dev, y_dev @ y_dev, x_dev @ y_dev
+        if len(x) < 2:
+            # A single overlapping day can't be fitted
+            metrics['Idiosyncratic Risk'] = metrics['R-Squared (vs Bench)'] = np.nan
+        elif ss_x > 0:
+            slope = ss_xy / ss_x
+            residuals = y_dev - slope * x_dev
+            r_value = np.clip(ss_xy / np.sqrt(ss_x * ss_y), -1.0, 1.0) if ss_y > 0 else 0.0
+            
+            # Annualize Std Dev of Residuals
+            metrics['Idiosyncratic Risk'] = residuals.std(ddof=1) * np.sqrt(252)
+            metrics['R-Squared (vs Bench)'] = r_value**2
 
     # --- B. FACTOR COEFFICIENTS (BETAS) ---
     factors = {
@@ -90,25 +117,26 @@ def calculate_portfolio_risk(daily_nav_df, benchmark_series, rf_rate=None):
             end_d = (port_returns.index.max() + pd.Timedelta(days=1)).strftime('%Y-%m-%d')
             
             tickers = list(factors.values())
-            f_data = yf.download(tickers, start=start_d, end=end_d, progress=False)['Close']
+            f_data = download_cached(tickers, start=start_d, end=end_d, progress=False)['Close']
             
             if not f_data.empty:
                 f_rets = f_data.pct_change().dropna()
                 
                 # Align Portfolio with Factors
                 aligned_factors = pd.concat([port_returns, f_rets], axis=1, join='inner').dropna()
-                aligned_factors = aligned_factors.dropna()
                 
-                if not aligned_factors.empty:
-                    y_port = aligned_factors.iloc[:, 0] # Portfolio is first column
+                if len(aligned_factors) > 1:
+                    y_port = aligned_factors.iloc[:, 0].to_numpy(dtype=float) # Portfolio is first column
+                    present = {label: ticker for label, ticker in factors.items() if ticker in aligned_factors.columns}
                     
-                    for label, ticker in factors.items():
-                        if ticker in aligned_factors.columns:
-                            x_factor = aligned_factors[ticker]
-                            if len(x_factor) > 1:
-                                # Univariate Regression
-                                beta, _, _, _, _ = stats.linregress(x_factor, y_port)
-                                metrics[f'Beta: {label}'] = beta
+                    # Univariate regression slopes for every factor at once: cov(x, y) / var(x)
+                    x_dev = aligned_factors[list(present.values())].to_numpy(dtype=float)
+                    x_dev = x_dev - x_dev.mean(axis=0)
+                    y_dev = y_port - y_port.mean()
+                    ss_x = (x_dev * x_dev).sum(axis=0)
+                    betas = np.divide(y_dev @ x_dev, ss_x, out=np.zeros_like(ss_x), where=ss_x > 0)
+                    for label, beta in zip(present, betas):
+                        metrics[f'Beta: {label}'] = beta
                             
     except Exception as e:
         print(f"   > Warning: Factor calculation failed: {e}")
@@ -131,7 +159,8 @@ def calculate_descriptive_risk_stats(daily_nav_df, rf_rate=None):
         rf_rate = get_live_risk_free_rate(default_rate=0.04)
     
     df = daily_nav_df.copy()
-    df['date'] = pd.to_datetime(df['date'])
+    if not pd.api.types.is_datetime64_any_dtype(df['date']):
+        df['date'] = pd.to_datetime(df['date'])
     df = df.sort_values('date').reset_index(drop=True)
     
     nav = df['nav'].values
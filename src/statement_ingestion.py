@@ -7,6 +7,7 @@ from pathlib import Path
 import pandas as pd
 
 _IBKR_ACCOUNT_RE = re.compile(r'^U\d+$')
+_NUMBER_NOISE = str.maketrans('', '', ',$%')  # thousands separators, currency and percent signs
 
 SECTION_HEADER = "Header"
 SECTION_DATA = "Data"
@@ -73,7 +74,8 @@ def read_quarter_statement_csv(path: str | Path) -> tuple[dict[str, pd.DataFrame
         raise FileNotFoundError(f"Statement CSV not found at {path}")
 
     headers: dict[str, list[str]] = {}
-    rows: dict[str, list[dict[str, str]]] = defaultdict(list)
+    rows: dict[str, list[list[str]]] = defaultdict(list)
+    row_headers: dict[str, list[list[str]]] = defaultdict(list)  # header in force for each data row
     metainfo: dict[str, dict[str, str]] = defaultdict(dict)
 
     with path.open("r", encoding="utf-8-sig", newline="") as handle:
@@ -90,7 +92,8 @@ def read_quarter_statement_csv(path: str | Path) -> tuple[dict[str, pd.DataFrame
                 values = [cell.strip() for cell in raw_row[2:]]
                 if header:
                     padded = values + [""] * (len(header) - len(values))
-                    rows[section].append(dict(zip(header, padded[: len(header)])))
+                    rows[section].append(padded[: len(header)])
+                    row_headers[section].append(header)
             elif record_type == SECTION_META:
                 # MetaInfo format: Section, MetaInfo, Key, Value
                 if len(raw_row) >= 4:
@@ -98,7 +101,16 @@ def read_quarter_statement_csv(path: str | Path) -> tuple[dict[str, pd.DataFrame
                     val = raw_row[3].strip()
                     metainfo[section][key] = val
 
-    dfs = {k: pd.DataFrame(v) for k, v in rows.items()}
+    dfs = {}
+    for section, values in rows.items():
+        section_headers = row_headers[section]
+        header = section_headers[0]
+        if len(set(header)) == len(header) and all(h == header for h in section_headers):
+            # Usual case: one header per section, so the rows are already the columns in order
+            dfs[section] = pd.DataFrame(values, columns=header)
+        else:
+            # Re-headed sections or repeated column names: key by name, as the union of all headers
+            dfs[section] = pd.DataFrame([dict(zip(h, v)) for h, v in zip(section_headers, values)])
     return dfs, metainfo
 
 
@@ -255,7 +267,7 @@ def _coerce_float(value) -> float:
     if pd.isna(value) or value is None or value == "": return 0.0
     if isinstance(value, (int, float)): return float(value)
     
-    cleaned = str(value).replace(",", "").replace("$", "").replace("%", "").strip()
+    cleaned = str(value).translate(_NUMBER_NOISE).strip()
     if not cleaned: return 0.0
     
     if cleaned.startswith("(") and cleaned.endswith(")"):
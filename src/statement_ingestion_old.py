@@ -4,9 +4,12 @@ from collections import defaultdict
 from dataclasses import dataclass
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 from return_metrics import calculate_nav_performance
 
+_DIVIDEND_SYMBOL_RE = re.compile(r"^([A-Z0-9.]+)\(")  # "VTI(US9229087690) Cash Dividend ..." -> VTI
+
 SECTION_HEADER = "Header"
 SECTION_DATA = "Data"
 
@@ -125,11 +128,11 @@ def extract_statement_metadata(statement: pd.DataFrame) -> StatementMetadata:
     if statement.empty:
         return StatementMetadata(title=None, period=None, when_generated=None)
 
+    # Normalized Field Name -> Field Value, built once (later rows overwrite: last match wins)
+    field_values = dict(zip(statement["Field Name"].str.strip().str.lower(), statement["Field Value"]))
+
     def lookup(field_name: str) -> str | None:
-        matches = statement[statement["Field Name"].str.strip().str.lower() == field_name.lower()]
-        if matches.empty:
-            return None
-        value = matches["Field Value"].iloc[-1]
+        value = field_values.get(field_name.lower())
         if isinstance(value, str):
             value = value.strip()
         return value if value else None
@@ -154,7 +157,7 @@ def extract_account_name(accounts_df: pd.DataFrame) -> str:
 def extract_symbol_from_description(description: str) -> str | None:
     if not description: return None
     try:
-        match = re.match(r"^([A-Z0-9.]+)\(", description.strip())
+        match = _DIVIDEND_SYMBOL_RE.match(description.strip())
         return match.group(1) if match else None
     except Exception:
         return None
@@ -302,11 +305,13 @@ def calculate_cumulative_returns_with_dividends(sections: StatementSections) ->
     div_map = {}
     if not sections.dividends.empty:
         d_df = sections.dividends.copy()
-        if "Symbol" not in d_df.columns and "Description" in d_df.columns:
+        if "Symbol" in d_df.columns:
+            d_df['Symbol'] = d_df['Symbol'].str.strip().str.upper()
+        elif "Description" in d_df.columns:
+            # Already normalized: the description pattern only matches upper-case symbols with no spaces
             d_df['Symbol'] = d_df['Description'].apply(extract_symbol_from_description)
             
         if "Symbol" in d_df.columns:
-            d_df['Symbol'] = d_df['Symbol'].str.strip().str.upper()
             d_df = d_df[d_df['Symbol'].apply(is_valid_ticker)]
             d_df['Amount'] = d_df['Amount'].apply(_coerce_float)
             div_map = d_df.groupby('Symbol')['Amount'].sum().to_dict()
@@ -316,44 +321,35 @@ def calculate_cumulative_returns_with_dividends(sections: StatementSections) ->
     all_tickers.discard(None)
     all_tickers.discard('')
 
-    final_rows = []
-    
-    for ticker in all_tickers:
-        held_rows = df[df['Symbol'] == ticker]
-        
-        if not held_rows.empty:
-            cost = held_rows['cost_basis'].sum()
-            mv = held_rows['market_value'].sum()
-            
-            # Safety Valve: Fix infinite return on Cash-like positions
-            if cost == 0.0 and mv != 0.0:
-                cost = mv
-        else:
-            cost = 0.0
-            mv = 0.0
-            
-        r_pl = realized_pl_map.get(ticker, 0.0)
-        divs = div_map.get(ticker, 0.0)
-        
-        final_rows.append({
-            'ticker': ticker,
-            'avg_cost': cost,
-            'raw_value': mv,
-            'realized_pl': r_pl,
-            'total_dividends': divs
-        })
-        
-    final_df = pd.DataFrame(final_rows)
+    # Per-symbol totals of the open lots, summed once instead of a mask per ticker
+    held = df.groupby('Symbol')[['cost_basis', 'market_value']].sum()
+    held_cost = held['cost_basis'].to_dict()
+    held_mv = held['market_value'].to_dict()
+
+    # One column per field (tickers with no open lots get 0.0 cost and value)
+    tickers = list(all_tickers)
+    cost = np.array([held_cost.get(t, 0.0) for t in tickers], dtype=float)
+    mv = np.array([held_mv.get(t, 0.0) for t in tickers], dtype=float)
+
+    # Safety Valve: Fix infinite return on Cash-like positions
+    cost = np.where((cost == 0.0) & (mv != 0.0), mv, cost)
+
+    final_df = pd.DataFrame({
+        'ticker': tickers,
+        'avg_cost': cost,
+        'raw_value': mv,
+        'realized_pl': [realized_pl_map.get(t, 0.0) for t in tickers],
+        'total_dividends': [div_map.get(t, 0.0) for t in tickers],
+    })
 
     if not final_df.empty:
         final_df['total_generated_value'] = final_df['raw_value'] + final_df['total_dividends'] + final_df['realized_pl']
         
-        def calc_ret(row):
-            if row['avg_cost'] != 0:
-                return (row['total_generated_value'] / row['avg_cost']) - 1.0
-            return 0.0
-
-        final_df['cumulative_return'] = final_df.apply(calc_ret, axis=1)
+        # (value / cost) - 1 per ticker; 0.0 where there is no cost
+        cost = final_df['avg_cost'].to_numpy(dtype=float)
+        generated = final_df['total_generated_value'].to_numpy(dtype=float)
+        ratio = np.divide(generated, cost, out=np.ones_like(generated), where=cost != 0)
+        final_df['cumulative_return'] = ratio - 1.0
     
     return CumulativeReturnResults(positions=final_df)
 
@@ -1,5 +1,55 @@
 import yfinance as yf
 import pandas as pd
+import os
+import pickle
+import hashlib
+import datetime
+
+# (tickers, start, end) -> returns frame. Batch runs ask for the same benchmark set and
+# date range for many accounts; only successful downloads are kept.
+_RETURNS_CACHE = {}
+
+# Same-day on-disk copy of Yahoo responses, shared by the report worker processes and by
+# reruns. Entries written on an earlier day are ignored. Set to None to always hit Yahoo.
+YF_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.gaard_cache')
+
+def _disk_cache_path(key):
+    return os.path.join(YF_CACHE_DIR, hashlib.sha1(repr(key).encode()).hexdigest() + '.pkl')
+
+def disk_cache_get(key):
+    """Returns the object cached under key today, or None (missing, stale or unreadable)."""
+    if not YF_CACHE_DIR: return None
+    path = _disk_cache_path(key)
+    try:
+        if datetime.date.fromtimestamp(os.path.getmtime(path)) != datetime.date.today(): return None
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+    except Exception:
+        return None
+
+def disk_cache_put(key, value):
+    """Stores value under key. Written to a temp file first so concurrent workers never read half a file."""
+    if not YF_CACHE_DIR: return
+    try:
+        os.makedirs(YF_CACHE_DIR, exist_ok=True)
+        path = _disk_cache_path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(value, f)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        print(f"   > Warning: Could not write Yahoo cache ({e}).")
+
+def download_cached(tickers, **download_kwargs):
+    """yf.download() behind the same-day disk cache, keyed by the sorted tickers and the download arguments."""
+    ticker_key = (tickers,) if isinstance(tickers, str) else tuple(sorted(tickers))
+    key = ('download', ticker_key, tuple(sorted((k, str(v)) for k, v in download_kwargs.items())))
+    data = disk_cache_get(key)
+    if data is None:
+        data = yf.download(tickers, **download_kwargs)
+        if not data.empty:
+            disk_cache_put(key, data)
+    return data
 
 def fetch_benchmark_returns_yf(tickers, start_date=None, end_date=None):
     """
@@ -10,12 +60,16 @@ def fetch_benchmark_returns_yf(tickers, start_date=None, end_date=None):
         return pd.DataFrame()
     
     # Deduplicate and clean tickers
-    unique_tickers = list(set([t.upper() for t in tickers]))
+    unique_tickers = sorted({t.upper() for t in tickers})
+    cache_key = (tuple(unique_tickers), str(start_date), str(end_date))
+    if cache_key in _RETURNS_CACHE:
+        print(f"Using cached Yahoo Finance data for {len(unique_tickers)} symbols.")
+        return _RETURNS_CACHE[cache_key].copy()
     print(f"Fetching data for {len(unique_tickers)} symbols via Yahoo Finance...")
     
     try:
         # download() with auto_adjust=True gives us Total Return (Divs + Splits included)
-        data = yf.download(
+        data = download_cached(
             unique_tickers, 
             start=start_date, 
             progress=False, 
@@ -39,16 +93,20 @@ def fetch_benchmark_returns_yf(tickers, start_date=None, end_date=None):
             else:
                 return pd.DataFrame()
 
+        # Cut off data strictly at the report date (before pct_change, which only looks back,
+        # so rows past the report date are never turned into returns)
+        if end_date:
+            prices = prices.loc[:end_date]
+
         # Convert Prices -> Returns
         returns = prices.pct_change(fill_method=None)
-        
-        # Cut off data strictly at the report date
-        if end_date:
-            returns = returns.loc[:end_date]
             
         # Yahoo often returns data slightly before start_date if using 'max', 
         # but here we are good. We just drop the first NaN row.
-        return returns.dropna(how='all')
+        returns = returns.dropna(how='all')
+        if not returns.empty:
+            _RETURNS_CACHE[cache_key] = returns.copy()
+        return returns
 
     except Exception as e:
         print(f"Yahoo Finance Error: {e}")